@@ -58,6 +58,7 @@ Multi-Provider Example:
 
 __version__ = "0.1.0"
 
+from .cache import CacheBackend, LLMCache, MemoryBackend
 from .client import CmdrData, track_ai
 from .context import (
     clear_customer_context,
@@ -73,11 +74,18 @@ from .exceptions import (
     TrackingError,
     ValidationError,
 )
+from .tracker import InMemoryTracker, TrackerBackend
 
 __all__ = [
     # Main client
     "CmdrData",
     "track_ai",
+    "InMemoryTracker",
+    "TrackerBackend",
+    # Response caching
+    "LLMCache",
+    "CacheBackend",
+    "MemoryBackend",
     # Context management
     "customer_context",
     "set_customer_context",
@@ -0,0 +1,138 @@
+"""
+Response caching for deterministic AI calls
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Protocol, Tuple
+
+try:
+    import orjson
+
+    def _key_payload(value: Any) -> bytes:
+        """Serialize call arguments to canonical JSON bytes"""
+        return orjson.dumps(
+            value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+
+except ImportError:  # orjson is an optional speedup
+
+    def _key_payload(value: Any) -> bytes:
+        """Serialize call arguments to canonical JSON bytes"""
+        return json.dumps(value, sort_keys=True, separators=(",", ":")).encode()
+
+
+# Parameters that make a call non-deterministic or give it side effects
+_UNCACHEABLE_KWARGS = ("tools", "functions", "tool_choice", "function_call")
+
+
+class CacheBackend(Protocol):
+    """
+    Storage used by LLMCache.
+
+    Implement get and set to keep cached responses somewhere other than
+    process memory.
+    """
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response for key, or None"""
+        ...
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a response under key"""
+        ...
+
+
+class MemoryBackend:
+    """
+    In-process LRU cache backend.
+
+    Args:
+        max_entries: Number of responses kept before the least recently
+            used one is evicted
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response for key, or None"""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a response under key, evicting the oldest if full"""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        with self._lock:
+            self._entries.clear()
+
+
+class LLMCache:
+    """
+    Cache for deterministic AI calls.
+
+    Only calls made with temperature=0 are cached. Streaming calls and
+    calls that pass tools or functions are never cached. Cached responses
+    are returned as-is, so the same object is shared between hits.
+
+    Args:
+        backend: Where cached responses are stored (defaults to an
+            in-memory LRU)
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        self.backend: CacheBackend = backend if backend is not None else MemoryBackend()
+
+    def key(
+        self,
+        provider: str,
+        method_name: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Optional[str]:
+        """
+        Build the cache key for a call.
+
+        Args:
+            provider: Provider name
+            method_name: Full name of the called method
+            args: Method arguments
+            kwargs: Method keyword arguments
+
+        Returns:
+            Cache key, or None if the call must not be cached
+        """
+        if kwargs.get("temperature") != 0 or kwargs.get("stream"):
+            return None
+        if any(kwargs.get(name) for name in _UNCACHEABLE_KWARGS):
+            return None
+
+        try:
+            payload = _key_payload([provider, method_name, args, kwargs])
+        except (TypeError, ValueError):
+            # Arguments we can't hash reliably are never cached
+            return None
+
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response for key, or None"""
+        return self.backend.get(key)
+
+    def set(self, key: str, response: Any) -> None:
+        """Cache a response under key"""
+        self.backend.set(key, response)
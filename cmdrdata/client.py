@@ -2,19 +2,259 @@
 Universal AI client wrapper for automatic usage tracking
 """
 
+import functools
+import inspect
 import logging
 import os
+import re
+import sys
 import threading
 import time
+import traceback
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any, Callable, Dict, Optional, Tuple, Union
 
+from .cache import CacheBackend, LLMCache
 from .context import get_customer_context, get_metadata_context
 from .exceptions import ConfigurationError, ValidationError
-from .tracker import UsageTracker
+from .tracker import TrackerBackend, UsageTracker, close_session
 
 logger = logging.getLogger(__name__)
 
+# Call parameters consumed by CmdrData and never passed to the client
+_RESERVED_KWARGS = ("customer_id", "metadata")
+
+# Longest error message sent with a tracked error event
+_MAX_ERROR_MESSAGE_LENGTH = 512
+
+
+# Shared trackers by (api_key, endpoint, disabled), least recently used first
+_TRACKER_CACHE_SIZE = 64
+_trackers: "OrderedDict[Tuple[Optional[str], str, bool], UsageTracker]" = OrderedDict()
+_trackers_lock = threading.Lock()
+
+
+def _get_tracker(api_key: Optional[str], endpoint: str, disabled: bool) -> UsageTracker:
+    """
+    Get the shared tracker for an API key and endpoint.
+
+    Wrappers with the same configuration share one tracker, and with it
+    one background queue. A tracker disabled after the API rejected its
+    key is replaced, so wrappers created later try the key again.
+    """
+    key = (api_key, endpoint, disabled)
+    with _trackers_lock:
+        tracker = _trackers.get(key)
+        if tracker is None or (tracker.disabled and api_key and not disabled):
+            tracker = UsageTracker(
+                api_key=api_key, endpoint=endpoint, disabled=disabled
+            )
+            _trackers[key] = tracker
+            if len(_trackers) > _TRACKER_CACHE_SIZE:
+                _trackers.popitem(last=False)
+        _trackers.move_to_end(key)
+        return tracker
+
+
+# Top-level client packages, matched on whole module path segments
+_PROVIDER_MODULES = {
+    "openai": "openai",
+    "anthropic": "anthropic",
+    "google.generativeai": "google",
+    "google.genai": "google",
+    "google.cloud.aiplatform": "google",
+    "vertexai": "google",
+    "cohere": "cohere",
+    "huggingface_hub": "huggingface",
+    "transformers": "huggingface",
+    "replicate": "replicate",
+    "together": "together",
+    "perplexity": "perplexity",
+    "mistralai": "mistral",
+}
+_PROVIDER_RE = re.compile(
+    r"^(" + "|".join(re.escape(name) for name in _PROVIDER_MODULES) + r")(?:\.|$)"
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _detect_provider(cls: type) -> str:
+    """
+    Detect the AI provider from a client class.
+
+    Results are cached per class, so repeated wrapping of the same client
+    type skips the module and class name scan.
+
+    Args:
+        cls: The AI client class
+
+    Returns:
+        Detected provider name
+    """
+    # Check module name first (most reliable)
+    match = _PROVIDER_RE.match(cls.__module__.lower())
+    if match:
+        return _PROVIDER_MODULES[match.group(1)]
+
+    # Check class name as fallback
+    client_type = cls.__name__.lower()
+    if "openai" in client_type:
+        return "openai"
+    elif "anthropic" in client_type or "claude" in client_type:
+        return "anthropic"
+    elif "gemini" in client_type or "generative" in client_type:
+        return "google"
+
+    return "unknown"
+
+
+def _usage(
+    input_tokens: Any = 0, output_tokens: Any = 0, total_tokens: Any = 0
+) -> Dict[str, Any]:
+    """Build a usage dict, calculating the total if it wasn't provided."""
+    if total_tokens == 0:
+        total_tokens = input_tokens + output_tokens
+    return {
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "total_tokens": total_tokens,
+    }
+
+
+def _extract_generic(response: Any) -> Dict[str, Any]:
+    """
+    Extract token usage by probing the known response formats.
+
+    Used for providers without a dedicated extractor, and as the fallback
+    when a response doesn't have the shape its provider usually returns.
+    """
+    # First check if response is a dict (Cohere V2, some others)
+    if isinstance(response, dict):
+        usage = response.get("usage")
+        if isinstance(usage, dict):
+            # Cohere V2 pattern with nested billed_units
+            units = usage.get("billed_units")
+            if units is None:
+                units = usage.get("tokens")
+            if units is not None:
+                return _usage(
+                    units.get("input_tokens", 0), units.get("output_tokens", 0)
+                )
+
+            # Standard dict patterns
+            if "prompt_tokens" in usage:
+                return _usage(
+                    usage.get("prompt_tokens", 0),
+                    usage.get("completion_tokens", 0),
+                    usage.get("total_tokens", 0),
+                )
+            if "input_tokens" in usage:
+                return _usage(
+                    usage.get("input_tokens", 0),
+                    usage.get("output_tokens", 0),
+                    usage.get("total_tokens", 0),
+                )
+        return _usage()
+
+    # Check for object with usage attribute
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        # OpenAI pattern (prompt_tokens, completion_tokens)
+        prompt_tokens = getattr(usage, "prompt_tokens", None)
+        if prompt_tokens is not None:
+            return _usage(
+                prompt_tokens,
+                getattr(usage, "completion_tokens", 0),
+                getattr(usage, "total_tokens", 0),
+            )
+
+        # Anthropic pattern (input_tokens, output_tokens)
+        input_tokens = getattr(usage, "input_tokens", None)
+        if input_tokens is not None:
+            return _usage(input_tokens, getattr(usage, "output_tokens", 0))
+        return _usage()
+
+    # Google/Gemini pattern
+    usage = getattr(response, "usage_metadata", None)
+    if usage is not None:
+        return _usage(
+            getattr(usage, "prompt_token_count", 0),
+            getattr(usage, "candidates_token_count", 0),
+            getattr(usage, "total_token_count", 0),
+        )
+
+    # Cohere V1 pattern with meta attribute
+    meta = getattr(response, "meta", None)
+    if meta is not None:
+        units = getattr(meta, "billed_units", None)
+        if units is not None:
+            return _usage(
+                getattr(units, "input_tokens", 0), getattr(units, "output_tokens", 0)
+            )
+
+    return _usage()
+
+
+def _extract_openai(response: Any) -> Dict[str, Any]:
+    """Extract usage from an OpenAI response (usage.prompt_tokens etc.)."""
+    try:
+        usage = response.usage
+        return _usage(usage.prompt_tokens, usage.completion_tokens, usage.total_tokens)
+    except (AttributeError, KeyError, TypeError):
+        return _extract_generic(response)
+
+
+def _extract_anthropic(response: Any) -> Dict[str, Any]:
+    """Extract usage from an Anthropic response (usage.input_tokens etc.)."""
+    try:
+        usage = response.usage
+        return _usage(usage.input_tokens, usage.output_tokens)
+    except (AttributeError, KeyError, TypeError):
+        return _extract_generic(response)
+
+
+def _extract_cohere(response: Any) -> Dict[str, Any]:
+    """Extract usage from a Cohere V2 dict or V1 response with meta."""
+    try:
+        if isinstance(response, dict):
+            billed = response["usage"]["billed_units"]
+            return _usage(billed["input_tokens"], billed["output_tokens"])
+        units = response.meta.billed_units
+        return _usage(units.input_tokens, units.output_tokens)
+    except (AttributeError, KeyError, TypeError):
+        return _extract_generic(response)
+
+
+def _extract_google(response: Any) -> Dict[str, Any]:
+    """Extract usage from a Gemini response (usage_metadata)."""
+    try:
+        usage = response.usage_metadata
+        return _usage(
+            usage.prompt_token_count,
+            usage.candidates_token_count,
+            usage.total_token_count,
+        )
+    except (AttributeError, KeyError, TypeError):
+        return _extract_generic(response)
+
+
+def _preserve_method_attrs(
+    wrapper: Callable[..., Any], method: Callable[..., Any], method_name: str
+) -> Callable[..., Any]:
+    """Copy the name and docstring of a wrapped method onto its wrapper."""
+    wrapper.__name__ = getattr(method, "__name__", method_name)
+    wrapper.__doc__ = getattr(method, "__doc__", None)
+    return wrapper
+
+
+_EXTRACTORS: Dict[str, Callable[[Any], Dict[str, Any]]] = {
+    "openai": _extract_openai,
+    "anthropic": _extract_anthropic,
+    "cohere": _extract_cohere,
+    "google": _extract_google,
+}
+
 
 class CmdrData:
     """
@@ -26,12 +266,28 @@ class CmdrData:
 
     Attributes:
         client: The wrapped AI client instance
-        tracker: UsageTracker instance for sending events
+        tracker: Tracker that receives usage events (a UsageTracker by default)
         provider: Detected or specified provider name
         default_customer_id: Default customer ID for tracking
         default_metadata: Default metadata applied to all calls
     """
 
+    # Fixed attribute set: no per-instance __dict__. Assigning any other
+    # attribute is forwarded to the wrapped client.
+    __slots__ = (
+        "_client",
+        "tracker",
+        "provider",
+        "default_customer_id",
+        "default_metadata",
+        "_tracking_enabled",
+        "_wrapped_attrs",
+        "_event_base",
+        "_usage_extractor",
+        "_capture_traceback",
+        "_response_cache",
+    )
+
     def __init__(
         self,
         client: Optional[Any] = None,
@@ -44,6 +300,10 @@ class CmdrData:
         customer_id: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
         disable_tracking: bool = False,
+        enable_response_cache: bool = False,
+        cache_backend: Optional[CacheBackend] = None,
+        capture_traceback: bool = False,
+        tracker: Optional[TrackerBackend] = None,
     ):
         """
         Initialize the universal tracker.
@@ -59,6 +319,16 @@ class CmdrData:
             customer_id: Default customer ID for all requests
             metadata: Default metadata for all requests
             disable_tracking: Disable tracking (for testing)
+            enable_response_cache: Return cached responses for repeated
+                deterministic (temperature=0) calls instead of calling the
+                provider again. Applies to tracked calls only.
+            cache_backend: Storage for cached responses (defaults to an
+                in-memory LRU)
+            capture_traceback: Include the formatted traceback of failed
+                calls in tracked error events (for debugging)
+            tracker: TrackerBackend that receives usage events, such as
+                an InMemoryTracker.
+                Replaces the CmdrData API tracker; no API key is needed.
 
         Raises:
             ConfigurationError: If configuration is invalid
@@ -74,29 +344,35 @@ class CmdrData:
                 "Must provide either 'client' or both 'client_class' and 'client_kwargs'"
             )
 
-        # Get API key from parameter or environment
-        api_key = cmdrdata_api_key or os.getenv("CMDRDATA_API_KEY")
-        if not api_key and not disable_tracking:
-            logger.warning(
-                "No CmdrData API key provided. Tracking will be disabled. "
-                "Set cmdrdata_api_key parameter or CMDRDATA_API_KEY environment variable."
+        # Use the given tracker, or the shared one for this API key
+        self.tracker: TrackerBackend
+        if tracker is not None:
+            self.tracker = tracker
+        else:
+            # Get API key from parameter or environment
+            api_key = cmdrdata_api_key or os.getenv("CMDRDATA_API_KEY")
+            if not api_key and not disable_tracking:
+                logger.warning(
+                    "No CmdrData API key provided. Tracking will be disabled. "
+                    "Set cmdrdata_api_key parameter or CMDRDATA_API_KEY environment variable."
+                )
+                disable_tracking = True
+
+            self.tracker = _get_tracker(
+                api_key,
+                cmdrdata_url
+                or os.getenv("CMDRDATA_URL")
+                or "https://api.cmdrdata.ai/api/events",
+                disable_tracking,
             )
-            disable_tracking = True
-
-        # Initialize tracker
-        self.tracker = UsageTracker(
-            api_key=api_key,
-            endpoint=cmdrdata_url
-            or os.getenv("CMDRDATA_URL")
-            or "https://api.cmdrdata.ai/api/events",
-            disabled=disable_tracking,
-        )
 
         # Auto-detect or set provider
         if auto_detect_provider and not provider:
             self.provider = self.__detect_provider(self._client)
         else:
-            self.provider = provider or "unknown"
+            # Detected names are literals and already interned; intern
+            # user-supplied names too, as they key dispatch and every event
+            self.provider = sys.intern(provider) if provider else "unknown"
 
         # Store defaults
         self.default_customer_id = customer_id or os.getenv("CMDRDATA_CUSTOMER_ID")
@@ -106,6 +382,29 @@ class CmdrData:
         self._tracking_enabled = not disable_tracking
         self._wrapped_attrs: Dict[str, Any] = {}
 
+        # Per-instance parts of every tracking event, resolved once
+        self._event_base: Dict[str, Any] = {"provider": self.provider}
+        self._usage_extractor = _EXTRACTORS.get(self.provider, _extract_generic)
+
+        # Formatting tracebacks walks every frame, so it is opt-in
+        self._capture_traceback = capture_traceback
+
+        # Opt-in response cache
+        self._response_cache: Optional[LLMCache] = (
+            LLMCache(cache_backend) if enable_response_cache else None
+        )
+
+    @staticmethod
+    def close_pool() -> None:
+        """
+        Flush pending events and reset the shared trackers and connection pool.
+
+        Wrappers created afterwards get fresh trackers. Mainly useful in tests.
+        """
+        close_session()
+        with _trackers_lock:
+            _trackers.clear()
+
     def __detect_provider(self, client: Any) -> str:
         """
         Detect the AI provider from the client type.
@@ -116,36 +415,8 @@ class CmdrData:
         Returns:
             Detected provider name
         """
-        client_type = type(client).__name__.lower()
-        module = type(client).__module__.lower()
-
-        # Check module name first (most reliable)
-        if "openai" in module:
-            return "openai"
-        elif "anthropic" in module:
-            return "anthropic"
-        elif "google" in module or "genai" in module or "generativeai" in module:
-            return "google"
-        elif "cohere" in module:
-            return "cohere"
-        elif "huggingface" in module or "transformers" in module:
-            return "huggingface"
-        elif "replicate" in module:
-            return "replicate"
-        elif "together" in module:
-            return "together"
-        elif "perplexity" in module:
-            return "perplexity"
-
-        # Check class name as fallback
-        elif "openai" in client_type:
-            return "openai"
-        elif "anthropic" in client_type or "claude" in client_type:
-            return "anthropic"
-        elif "gemini" in client_type or "generative" in client_type:
-            return "google"
-
-        return "unknown"
+        client_class: type = type(client)
+        return _detect_provider(client_class)
 
     def __getattr__(self, name: str) -> Any:
         """
@@ -191,6 +462,30 @@ class CmdrData:
         # Return simple attributes as-is
         return attr
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Set wrapper state, or forward the assignment to the wrapped client.
+
+        Forwarded assignments drop any cached wrapper for that attribute.
+        """
+        if name in CmdrData.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._client, name, value)
+            self._wrapped_attrs.pop(name, None)
+
+    def __delattr__(self, name: str) -> None:
+        """
+        Delete wrapper state, or forward the deletion to the wrapped client.
+
+        Forwarded deletions drop any cached wrapper for that attribute.
+        """
+        if name in CmdrData.__slots__:
+            object.__delattr__(self, name)
+        else:
+            delattr(self._client, name)
+            self._wrapped_attrs.pop(name, None)
+
     def __wrap_method(
         self, method: Callable[..., Any], method_name: str
     ) -> Callable[..., Any]:
@@ -204,85 +499,165 @@ class CmdrData:
         Returns:
             Wrapped method that tracks usage
         """
+        # Whether a call is tracked only depends on the wrapper's settings and
+        # the method name, so untracked methods get a plain passthrough
+        if not self._tracking_enabled or not self.__should_track_method(method_name):
+            return self.__passthrough_method(method, method_name)
 
         def wrapped(*args: Any, **kwargs: Any) -> Any:
-            # Skip tracking if disabled
-            if not self._tracking_enabled:
-                return method(*args, **kwargs)
-
             # Extract CmdrData-specific parameters
             customer_id = (
                 kwargs.pop("customer_id", None)
                 or get_customer_context()
                 or self.default_customer_id
             )
-            extra_metadata = kwargs.pop("metadata", {})
-
-            # Merge metadata (defaults -> context -> call-specific)
-            metadata = {
-                **self.default_metadata,
-                **get_metadata_context(),
-                **extra_metadata,
-            }
+            extra_metadata = kwargs.pop("metadata", None)
+            context_metadata = get_metadata_context()
+
+            # Merge metadata (defaults -> context -> call-specific), skipping
+            # the merge when no layer has any
+            metadata: Optional[Dict[str, Any]] = None
+            if self.default_metadata or context_metadata or extra_metadata:
+                metadata = {
+                    **self.default_metadata,
+                    **context_metadata,
+                    **(extra_metadata or {}),
+                }
 
             # Track timing
             start_time = time.time()
 
-            try:
-                # Call the original method
-                response = method(*args, **kwargs)
-
-                # Track successful usage
-                if self.__should_track_method(method_name):
+            # Serve repeated deterministic calls from the response cache
+            cache = self._response_cache
+            if inspect.iscoroutinefunction(method):
+                # A cached coroutine can only be awaited once
+                cache = None
+            cache_key = None
+            if cache is not None:
+                cached = None
+                try:
+                    cache_key = cache.key(self.provider, method_name, args, kwargs)
+                    if cache_key is not None:
+                        cached = cache.get(cache_key)
+                except Exception as cache_error:
+                    # A broken cache backend must not fail the API call
+                    logger.debug(f"Response cache lookup failed: {cache_error}")
+                    cache_key = None
+                if cached is not None:
                     try:
                         self.__track_usage(
                             method_name=method_name,
                             args=args,
                             kwargs=kwargs,
-                            response=response,
+                            response=cached,
                             customer_id=customer_id,
                             metadata=metadata,
                             start_time=start_time,
-                            error_occurred=False,
+                            cache_hit=True,
                         )
                     except Exception as track_error:
                         # Log but don't fail the API call
                         logger.debug(f"Failed to track usage: {track_error}")
+                    return cached
 
-                return response
-
+            try:
+                # Call the original method
+                response = method(*args, **kwargs)
             except Exception as e:
                 # Track error
-                if self.__should_track_method(method_name):
-                    try:
-                        self.__track_usage(
-                            method_name=method_name,
-                            args=args,
-                            kwargs=kwargs,
-                            response=None,
-                            customer_id=customer_id,
-                            metadata=metadata,
-                            start_time=start_time,
-                            error_occurred=True,
-                            error_info={
-                                "error_type": type(e).__name__,
-                                "error_message": str(e),
-                            },
-                        )
-                    except Exception as track_error:
-                        # Log but don't fail the API call
-                        logger.debug(f"Failed to track error: {track_error}")
+                try:
+                    self.__track_usage(
+                        method_name=method_name,
+                        args=args,
+                        kwargs=kwargs,
+                        response=None,
+                        customer_id=customer_id,
+                        metadata=metadata,
+                        start_time=start_time,
+                        error_occurred=True,
+                        error_info=self.__error_info(e),
+                    )
+                except Exception as track_error:
+                    # Log but don't fail the API call
+                    logger.debug(f"Failed to track error: {track_error}")
 
                 # Re-raise the exception
                 raise
 
-        # Preserve method attributes
-        wrapped.__name__ = (
-            method.__name__ if hasattr(method, "__name__") else method_name
-        )
-        wrapped.__doc__ = method.__doc__ if hasattr(method, "__doc__") else None
+            if (
+                cache is not None
+                and cache_key is not None
+                and not inspect.isawaitable(response)
+            ):
+                try:
+                    cache.set(cache_key, response)
+                except Exception as cache_error:
+                    # Log but don't fail the API call
+                    logger.debug(f"Failed to cache response: {cache_error}")
+
+            # Track successful usage
+            try:
+                self.__track_usage(
+                    method_name=method_name,
+                    args=args,
+                    kwargs=kwargs,
+                    response=response,
+                    customer_id=customer_id,
+                    metadata=metadata,
+                    start_time=start_time,
+                    error_occurred=False,
+                )
+            except Exception as track_error:
+                # Log but don't fail the API call
+                logger.debug(f"Failed to track usage: {track_error}")
+
+            return response
+
+        return _preserve_method_attrs(wrapped, method, method_name)
+
+    def __passthrough_method(
+        self, method: Callable[..., Any], method_name: str
+    ) -> Callable[..., Any]:
+        """
+        Wrap a method that is never tracked.
+
+        CmdrData-specific parameters are still removed before the call, so
+        code written for a tracked client works unchanged.
+
+        Args:
+            method: The method to wrap
+            method_name: Name of the method
+
+        Returns:
+            Wrapped method that calls straight through
+        """
+
+        def passthrough(*args: Any, **kwargs: Any) -> Any:
+            for name in _RESERVED_KWARGS:
+                kwargs.pop(name, None)
+            return method(*args, **kwargs)
 
-        return wrapped
+        return _preserve_method_attrs(passthrough, method, method_name)
+
+    def __error_info(self, error: Exception) -> Dict[str, Any]:
+        """
+        Describe a failed call for its tracking event.
+
+        Args:
+            error: Exception raised by the wrapped method
+
+        Returns:
+            Error fields for the event
+        """
+        error_info = {
+            "error_type": type(error).__name__,
+            "error_message": str(error)[:_MAX_ERROR_MESSAGE_LENGTH],
+        }
+        if self._capture_traceback:
+            error_info["error_traceback"] = "".join(
+                traceback.format_exception(type(error), error, error.__traceback__)
+            )
+        return error_info
 
     def __should_track_method(self, method_name: str) -> bool:
         """
@@ -329,10 +704,11 @@ class CmdrData:
         kwargs: Dict[str, Any],
         response: Any,
         customer_id: Optional[str],
-        metadata: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]],
         start_time: float,
         error_occurred: bool = False,
         error_info: Optional[Dict[str, Any]] = None,
+        cache_hit: bool = False,
     ) -> None:
         """
         Extract usage information and send to CmdrData.
@@ -347,6 +723,7 @@ class CmdrData:
             start_time: Request start time
             error_occurred: Whether an error occurred
             error_info: Error details if applicable
+            cache_hit: Whether the response was served from the cache
         """
         # Calculate duration
         duration_ms = int((time.time() - start_time) * 1000)
@@ -355,15 +732,19 @@ class CmdrData:
         usage_data = self.__extract_usage(response) if response else {}
         model = self.__extract_model(args, kwargs, response)
 
-        # Build tracking event
-        event = {
-            "customer_id": customer_id,
-            "model": model,
-            "provider": self.provider,
-            "metadata": metadata,
-            "request_duration_ms": duration_ms,
-            **usage_data,
-        }
+        # Build tracking event on top of the static per-instance fields
+        event = self._event_base.copy()
+        event["customer_id"] = customer_id
+        event["model"] = model
+        event["metadata"] = metadata or {}
+        event["request_duration_ms"] = duration_ms
+        if cache_hit:
+            # Nothing was billed; report the tokens the cache saved instead
+            event.update(_usage())
+            event["cache_hit"] = True
+            event["cached_tokens"] = usage_data.get("total_tokens", 0)
+        else:
+            event.update(usage_data)
 
         if error_occurred and error_info:
             event["error_occurred"] = True
@@ -376,7 +757,9 @@ class CmdrData:
         """
         Extract token usage from various response formats.
 
-        This method handles different response formats from various providers.
+        The extractor is picked by provider when the wrapper is created, so
+        the expected format is read directly and the generic probes only run
+        when it doesn't match.
 
         Args:
             response: Response object from AI provider
@@ -384,74 +767,10 @@ class CmdrData:
         Returns:
             Dictionary with input_tokens, output_tokens, total_tokens
         """
-        usage_data = {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0}
-
         if not response:
-            return usage_data
+            return _usage()
 
-        # First check if response is a dict (Cohere V2, some others)
-        if isinstance(response, dict):
-            if "usage" in response:
-                usage = response["usage"]
-                # Cohere V2 pattern with nested billed_units
-                if isinstance(usage, dict):
-                    if "billed_units" in usage:
-                        billed = usage["billed_units"]
-                        usage_data["input_tokens"] = billed.get("input_tokens", 0)
-                        usage_data["output_tokens"] = billed.get("output_tokens", 0)
-                    elif "tokens" in usage:
-                        tokens = usage["tokens"]
-                        usage_data["input_tokens"] = tokens.get("input_tokens", 0)
-                        usage_data["output_tokens"] = tokens.get("output_tokens", 0)
-                    # Standard dict patterns
-                    elif "prompt_tokens" in usage:
-                        usage_data["input_tokens"] = usage.get("prompt_tokens", 0)
-                        usage_data["output_tokens"] = usage.get("completion_tokens", 0)
-                        usage_data["total_tokens"] = usage.get("total_tokens", 0)
-                    elif "input_tokens" in usage:
-                        usage_data["input_tokens"] = usage.get("input_tokens", 0)
-                        usage_data["output_tokens"] = usage.get("output_tokens", 0)
-                        usage_data["total_tokens"] = usage.get("total_tokens", 0)
-
-        # Check for object with usage attribute
-        elif hasattr(response, "usage"):
-            usage = response.usage
-            # OpenAI pattern (prompt_tokens, completion_tokens)
-            if hasattr(usage, "prompt_tokens"):
-                usage_data["input_tokens"] = getattr(usage, "prompt_tokens", 0)
-                if hasattr(usage, "completion_tokens"):
-                    usage_data["output_tokens"] = getattr(usage, "completion_tokens", 0)
-                if hasattr(usage, "total_tokens"):
-                    usage_data["total_tokens"] = getattr(usage, "total_tokens", 0)
-
-            # Anthropic pattern (input_tokens, output_tokens)
-            elif hasattr(usage, "input_tokens"):
-                usage_data["input_tokens"] = getattr(usage, "input_tokens", 0)
-                if hasattr(usage, "output_tokens"):
-                    usage_data["output_tokens"] = getattr(usage, "output_tokens", 0)
-
-        # Google/Gemini pattern
-        elif hasattr(response, "usage_metadata"):
-            usage = response.usage_metadata
-            usage_data["input_tokens"] = getattr(usage, "prompt_token_count", 0)
-            usage_data["output_tokens"] = getattr(usage, "candidates_token_count", 0)
-            usage_data["total_tokens"] = getattr(usage, "total_token_count", 0)
-
-        # Cohere V1 pattern with meta attribute
-        elif hasattr(response, "meta"):
-            meta = response.meta
-            if hasattr(meta, "billed_units"):
-                units = meta.billed_units
-                usage_data["input_tokens"] = getattr(units, "input_tokens", 0)
-                usage_data["output_tokens"] = getattr(units, "output_tokens", 0)
-
-        # Calculate total if not provided
-        if usage_data["total_tokens"] == 0:
-            usage_data["total_tokens"] = (
-                usage_data["input_tokens"] + usage_data["output_tokens"]
-            )
-
-        return usage_data
+        return self._usage_extractor(response)
 
     def __extract_model(
         self, args: Tuple[Any, ...], kwargs: Dict[str, Any], response: Any
@@ -473,12 +792,13 @@ class CmdrData:
 
         # Check response for model info (as attribute)
         if response:
-            if hasattr(response, "model"):
-                return str(response.model)
-            elif hasattr(response, "model_name"):
-                return str(response.model_name)
+            model = getattr(response, "model", None)
+            if model is None:
+                model = getattr(response, "model_name", None)
+            if model is not None:
+                return str(model)
             # Check if model is in response dict
-            elif isinstance(response, dict) and "model" in response:
+            if isinstance(response, dict) and "model" in response:
                 return str(response["model"])
 
         # Check if first arg looks like a model name (not a prompt)
@@ -499,9 +819,18 @@ class CmdrDataProxy:
     Proxy object for nested attributes (like client.chat.completions).
 
     This allows us to maintain the chain of attribute access while
-    still intercepting method calls for tracking.
+    still intercepting method calls for tracking. Wrapped methods and
+    nested proxies are cached, so repeated access to the same attribute
+    chain reuses the same objects.
     """
 
+    __slots__ = ("_wrapped", "_parent", "_path", "_cache")
+
+    _wrapped: Any
+    _parent: "CmdrData"
+    _path: str
+    _cache: Dict[str, Any]
+
     def __init__(self, wrapped_obj: Any, parent: CmdrData, path: str):
         """
         Initialize proxy for nested object.
@@ -525,20 +854,55 @@ class CmdrDataProxy:
         Returns:
             Wrapped attribute or method
         """
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+
         attr = getattr(self._wrapped, name)
         full_path = f"{self._path}.{name}"
 
         if callable(attr):
-            return self._parent._CmdrData__wrap_method(attr, full_path)
+            wrapped = self._parent._CmdrData__wrap_method(attr, full_path)
+            self._cache[name] = wrapped
+            return wrapped
 
         # Continue wrapping nested objects
         if hasattr(attr, "__dict__") and not isinstance(
             attr, (str, int, float, bool, list, dict)
         ):
-            return CmdrDataProxy(attr, self._parent, full_path)
+            proxy = CmdrDataProxy(attr, self._parent, full_path)
+            self._cache[name] = proxy
+            return proxy
 
         return attr
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Set proxy state, or forward the assignment to the wrapped object.
+
+        Forwarded assignments drop any cached wrapper for that attribute.
+        """
+        if name in CmdrDataProxy.__slots__:
+            object.__setattr__(self, name, value)
+            if name == "_wrapped":
+                object.__setattr__(self, "_cache", {})
+        else:
+            setattr(self._wrapped, name, value)
+            self._cache.pop(name, None)
+
+    def __delattr__(self, name: str) -> None:
+        """
+        Delete proxy state, or forward the deletion to the wrapped object.
+
+        Forwarded deletions drop any cached wrapper for that attribute.
+        """
+        if name in CmdrDataProxy.__slots__:
+            object.__delattr__(self, name)
+        else:
+            delattr(self._wrapped, name)
+            self._cache.pop(name, None)
+
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         """
         Handle direct calls on proxy objects.
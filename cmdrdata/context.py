@@ -2,40 +2,43 @@
 Context management for customer IDs and metadata
 """
 
-import threading
 from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any, Dict, Generator, Optional
 
-# Thread-local storage for context
-_context = threading.local()
+# Context variables are isolated per thread and per asyncio task, and
+# follow the caller into asyncio.to_thread()
+_CUSTOMER: ContextVar[Optional[str]] = ContextVar("cmdrdata_customer", default=None)
+_METADATA: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "cmdrdata_metadata", default=None
+)
 
 
 def set_customer_context(customer_id: str) -> None:
     """
-    Set the customer ID for the current thread context.
+    Set the customer ID for the current thread or asyncio task.
 
     Args:
         customer_id: Customer identifier to set
     """
-    _context.customer_id = customer_id
+    _CUSTOMER.set(customer_id)
 
 
 def get_customer_context() -> Optional[str]:
     """
-    Get the current customer ID from thread context.
+    Get the customer ID for the current thread or asyncio task.
 
     Returns:
         Current customer ID or None
     """
-    return getattr(_context, "customer_id", None)
+    return _CUSTOMER.get()
 
 
 def clear_customer_context() -> None:
     """
-    Clear the customer ID from thread context.
+    Clear the customer ID for the current thread or asyncio task.
     """
-    if hasattr(_context, "customer_id"):
-        delattr(_context, "customer_id")
+    _CUSTOMER.set(None)
 
 
 @contextmanager
@@ -51,55 +54,49 @@ def customer_context(customer_id: str) -> Generator[None, None, None]:
             # All API calls here will use customer-123
             response = client.chat.completions.create(...)
     """
-    previous = get_customer_context()
-    set_customer_context(customer_id)
+    token = _CUSTOMER.set(customer_id)
     try:
         yield
     finally:
-        if previous is not None:
-            set_customer_context(previous)
-        else:
-            clear_customer_context()
+        _CUSTOMER.reset(token)
 
 
 def set_metadata_context(metadata: Dict[str, Any]) -> None:
     """
-    Set metadata for the current thread context.
+    Set metadata for the current thread or asyncio task.
 
     Args:
         metadata: Metadata dictionary to set
     """
-    _context.metadata = metadata
+    _METADATA.set(metadata)
 
 
 def get_metadata_context() -> Dict[str, Any]:
     """
-    Get the current metadata from thread context.
+    Get the metadata for the current thread or asyncio task.
 
     Returns:
         Current metadata dictionary or empty dict
     """
-    return getattr(_context, "metadata", {})
+    metadata = _METADATA.get()
+    return metadata if metadata is not None else {}
 
 
 def clear_metadata_context() -> None:
     """
-    Clear the metadata from thread context.
+    Clear the metadata for the current thread or asyncio task.
     """
-    if hasattr(_context, "metadata"):
-        delattr(_context, "metadata")
+    _METADATA.set(None)
 
 
 def update_metadata_context(metadata: Dict[str, Any]) -> None:
     """
-    Update (merge) metadata in the current thread context.
+    Update (merge) metadata for the current thread or asyncio task.
 
     Args:
         metadata: Metadata to merge with existing context
     """
-    current = get_metadata_context()
-    current.update(metadata)
-    set_metadata_context(current)
+    set_metadata_context({**get_metadata_context(), **metadata})
 
 
 @contextmanager
@@ -115,9 +112,8 @@ def metadata_context(metadata: Dict[str, Any]) -> Generator[None, None, None]:
             # All API calls here will include this metadata
             response = client.chat.completions.create(...)
     """
-    previous = get_metadata_context().copy()
-    set_metadata_context(metadata)
+    token = _METADATA.set(metadata)
     try:
         yield
     finally:
-        set_metadata_context(previous)
+        _METADATA.reset(token)
@@ -2,16 +2,93 @@
 Usage tracking implementation for CmdrData SDK
 """
 
+import atexit
 import json
 import logging
+import os
 import threading
-from datetime import datetime
-from typing import Any, Dict, Optional
+import time
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, List, Optional, Protocol, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _dumps(payload: Any) -> bytes:
+        """Serialize a payload to compact JSON bytes"""
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+
+except ImportError:  # orjson is an optional speedup
+
+    def _dumps(payload: Any) -> bytes:
+        """Serialize a payload to compact JSON bytes"""
+        return json.dumps(payload, separators=(",", ":")).encode()
+
+
+# Naive UTC epoch, matching the format of datetime.utcnow()
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _from_ns(ts_ns: int) -> datetime:
+    """Convert a time.time_ns() value to a naive UTC datetime"""
+    return _EPOCH + timedelta(microseconds=ts_ns // 1000)
+
+
+# Process-wide HTTP session so every tracker reuses pooled keep-alive connections
+_POOL_SIZE = min((os.cpu_count() or 1) * 2, 32)
+
+
+def _new_session() -> requests.Session:
+    """Create the shared HTTP session with pooled adapters"""
+    session = requests.Session()
+    session.mount(
+        "https://", HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE)
+    )
+    session.mount(
+        "http://", HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE)
+    )
+    return session
+
+
+def _new_pool() -> ThreadPoolExecutor:
+    """Create the shared worker pool that sends background events"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="cmdrdata-track")
+
+
+_session = _new_session()
+
+# Shared worker pool that sends background events for every tracker
+_TRACK_POOL = _new_pool()
+
+# Trackers with a background queue, flushed at interpreter shutdown
+_live_trackers: "weakref.WeakSet[UsageTracker]" = weakref.WeakSet()
+
+# Seconds allowed for sending queued events once the interpreter starts
+# exiting; whatever is still queued after that is dropped
+_EXIT_FLUSH_TIMEOUT = 5.0
+_exit_deadline: Optional[float] = None
+
+
+class TrackerBackend(Protocol):
+    """
+    Receiver of usage events from CmdrData.
+
+    Implement track_usage_background to send events somewhere other than
+    the CmdrData API.
+    """
+
+    def track_usage_background(self, **kwargs: Any) -> None:
+        """Accept one usage event, as keyword arguments for track_usage"""
+        ...
+
 
 class UsageTracker:
     """
@@ -19,6 +96,11 @@ class UsageTracker:
 
     This class manages the communication with CmdrData's tracking API,
     including authentication, error handling, and background processing.
+
+    Background events are queued in-process and drained by a worker pool
+    shared by all trackers. Events that queue up while a request is in
+    flight are coalesced and sent together to the batch endpoint. The queue
+    is bounded; when it is full the oldest event is dropped.
     """
 
     def __init__(
@@ -28,6 +110,9 @@ class UsageTracker:
         timeout: int = 5,
         max_retries: int = 3,
         disabled: bool = False,
+        batch_endpoint: Optional[str] = None,
+        max_batch_size: int = 128,
+        max_queue_size: int = 10_000,
     ):
         """
         Initialize the usage tracker.
@@ -38,12 +123,33 @@ class UsageTracker:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
             disabled: Whether tracking is disabled
+            batch_endpoint: API endpoint for sending batches of events
+                (defaults to ``endpoint`` + ``":batch"``)
+            max_batch_size: Maximum number of events sent in one request
+            max_queue_size: Maximum number of background events waiting to
+                be sent before the oldest are dropped
         """
         self.api_key = api_key
         self.endpoint = endpoint
+        self.batch_endpoint = batch_endpoint or f"{endpoint.rstrip('/')}:batch"
         self.timeout = timeout
         self.max_retries = max_retries
+        self.max_batch_size = max(1, max_batch_size)
         self.disabled = disabled
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            "User-Agent": "cmdrdata/0.1.0",
+        }
+
+        # Background queue state
+        self._queue: Deque[Tuple[int, Dict[str, Any]]] = deque(
+            maxlen=max(1, max_queue_size)
+        )
+        self._queue_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_scheduled = False
+        self.dropped_events = 0
 
         if not self.api_key and not self.disabled:
             logger.warning("No API key provided. Usage tracking disabled.")
@@ -89,7 +195,49 @@ class UsageTracker:
         if self.disabled:
             return False
 
-        # Build event payload
+        event = self._build_event(
+            customer_id=customer_id,
+            model=model,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            total_tokens=total_tokens,
+            provider=provider,
+            metadata=metadata,
+            timestamp=timestamp,
+            request_duration_ms=request_duration_ms,
+            error_occurred=error_occurred,
+            error_type=error_type,
+            error_message=error_message,
+            **kwargs,
+        )
+
+        # Send event
+        return self._send_event(event)
+
+    def _build_event(
+        self,
+        customer_id: Optional[str] = None,
+        model: str = "unknown",
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        total_tokens: int = 0,
+        provider: str = "unknown",
+        metadata: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[datetime] = None,
+        request_duration_ms: Optional[int] = None,
+        error_occurred: Optional[bool] = None,
+        error_type: Optional[str] = None,
+        error_message: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Build the event payload sent to CmdrData.
+
+        Accepts the same arguments as track_usage.
+
+        Returns:
+            Event payload
+        """
         event = {
             "customer_id": customer_id,
             "model": model,
@@ -113,14 +261,15 @@ class UsageTracker:
             if error_message:
                 event["error_message"] = error_message
 
-        # Send event
-        return self._send_event(event)
+        return event
 
     def track_usage_background(self, **kwargs: Any) -> None:
         """
-        Send a usage event in a background thread.
+        Queue a usage event to be sent by the background worker pool.
 
-        This method returns immediately and sends the event asynchronously.
+        This method returns immediately; the event is sent asynchronously,
+        batched with any other events queued in the meantime. If the queue
+        is full, the oldest queued event is dropped.
 
         Args:
             **kwargs: Arguments for track_usage
@@ -128,8 +277,66 @@ class UsageTracker:
         if self.disabled:
             return
 
-        thread = threading.Thread(target=self.track_usage, kwargs=kwargs, daemon=True)
-        thread.start()
+        with self._queue_lock:
+            if len(self._queue) == self._queue.maxlen:
+                self.dropped_events += 1
+            self._queue.append((time.time_ns(), kwargs))
+
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+
+        _live_trackers.add(self)
+        try:
+            _TRACK_POOL.submit(self._run_flush)
+        except RuntimeError:
+            # The pool is shut down at exit; the atexit flush sends the queue
+            with self._queue_lock:
+                self._flush_scheduled = False
+
+    def flush(self) -> None:
+        """
+        Send all queued background events now.
+
+        Blocks until the queue has been drained. Once the interpreter is
+        exiting, events still queued at the exit deadline are dropped.
+        """
+        with self._flush_lock:
+            while self._queue and not self.disabled:
+                if _exit_deadline is not None and time.monotonic() >= _exit_deadline:
+                    with self._queue_lock:
+                        dropped = len(self._queue)
+                        self._queue.clear()
+                    self.dropped_events += dropped
+                    logger.warning(f"Dropped {dropped} queued usage events at exit")
+                    break
+
+                batch: List[Tuple[int, Dict[str, Any]]] = []
+                with self._queue_lock:
+                    while self._queue and len(batch) < self.max_batch_size:
+                        batch.append(self._queue.popleft())
+                events = [
+                    self._build_event(**{"timestamp": _from_ns(ts_ns), **kwargs})
+                    for ts_ns, kwargs in batch
+                ]
+
+                if len(events) == 1:
+                    self._send_event(events[0])
+                else:
+                    self._send_batch(events)
+
+            if self.disabled:
+                with self._queue_lock:
+                    self._queue.clear()
+
+    def _run_flush(self) -> None:
+        """Flush the queue from a worker thread."""
+        with self._queue_lock:
+            self._flush_scheduled = False
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Unexpected error flushing usage events: {e}")
 
     def _send_event(self, event: Dict[str, Any]) -> bool:
         """
@@ -141,22 +348,55 @@ class UsageTracker:
         Returns:
             True if successful
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "User-Agent": "cmdrdata/0.1.0",
-        }
+        return self._post(self.endpoint, event, f"customer {event.get('customer_id')}")
+
+    def _send_batch(self, events: List[Dict[str, Any]]) -> bool:
+        """
+        Send a batch of events to the CmdrData batch API.
+
+        Args:
+            events: Event payloads
+
+        Returns:
+            True if successful
+        """
+        return self._post(self.batch_endpoint, events, f"{len(events)} events")
+
+    def _post(self, url: str, payload: Any, description: str) -> bool:
+        """
+        POST a payload to the CmdrData API with retries.
+
+        While the interpreter is exiting, only one attempt is made, with the
+        timeout capped by the time left before the exit deadline.
+
+        Args:
+            url: Endpoint to send to
+            payload: JSON-serializable event or list of events
+            description: What is being tracked, for log messages
 
-        for attempt in range(self.max_retries):
+        Returns:
+            True if successful
+        """
+        try:
+            body = _dumps(payload)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Failed to serialize usage event for {description}: {e}")
+            return False
+
+        attempts = self.max_retries
+        timeout: float = self.timeout
+        if _exit_deadline is not None:
+            attempts = 1
+            timeout = max(0.1, min(timeout, _exit_deadline - time.monotonic()))
+
+        for attempt in range(attempts):
             try:
-                response = requests.post(
-                    self.endpoint, json=event, headers=headers, timeout=self.timeout
+                response = _session.post(
+                    url, data=body, headers=self._headers, timeout=timeout
                 )
 
                 if response.status_code == 200:
-                    logger.debug(
-                        f"Successfully tracked usage for customer {event.get('customer_id')}"
-                    )
+                    logger.debug(f"Successfully tracked usage for {description}")
                     return True
                 elif response.status_code == 401:
                     logger.error("Invalid CmdrData API key")
@@ -164,7 +404,7 @@ class UsageTracker:
                     return False
                 elif response.status_code >= 500:
                     logger.warning(
-                        f"CmdrData API error {response.status_code}, attempt {attempt + 1}/{self.max_retries}"
+                        f"CmdrData API error {response.status_code}, attempt {attempt + 1}/{attempts}"
                     )
                     continue
                 else:
@@ -175,17 +415,129 @@ class UsageTracker:
 
             except requests.exceptions.Timeout:
                 logger.warning(
-                    f"Timeout tracking usage, attempt {attempt + 1}/{self.max_retries}"
+                    f"Timeout tracking usage, attempt {attempt + 1}/{attempts}"
                 )
                 continue
             except requests.exceptions.ConnectionError:
                 logger.warning(
-                    f"Connection error tracking usage, attempt {attempt + 1}/{self.max_retries}"
+                    f"Connection error tracking usage, attempt {attempt + 1}/{attempts}"
                 )
                 continue
             except Exception as e:
                 logger.error(f"Unexpected error tracking usage: {e}")
                 return False
 
-        logger.error(f"Failed to track usage after {self.max_retries} attempts")
+        logger.error(f"Failed to track usage after {attempts} attempts")
         return False
+
+
+class InMemoryTracker:
+    """
+    Tracker that keeps usage events in memory instead of sending them.
+
+    Pass one to CmdrData(tracker=...) to inspect events in tests, or to
+    forward them to your own metrics pipeline without a network hop.
+
+    Attributes:
+        events: Tracked events, oldest first, as the keyword arguments a
+            UsageTracker would receive
+    """
+
+    disabled = False
+
+    def __init__(self) -> None:
+        self.events: List[Dict[str, Any]] = []
+
+    def track_usage(self, **kwargs: Any) -> bool:
+        """
+        Record a usage event.
+
+        Args:
+            **kwargs: Event fields, as for UsageTracker.track_usage
+
+        Returns:
+            Always True
+        """
+        self.events.append(kwargs)
+        return True
+
+    def track_usage_background(self, **kwargs: Any) -> None:
+        """
+        Record a usage event.
+
+        Args:
+            **kwargs: Event fields, as for UsageTracker.track_usage
+        """
+        self.events.append(kwargs)
+
+    def flush(self) -> None:
+        """Nothing to send; present for parity with UsageTracker."""
+
+    def clear(self) -> None:
+        """Remove all recorded events."""
+        self.events.clear()
+
+
+def close_session() -> None:
+    """
+    Flush queued events and close pooled connections.
+
+    The shared session opens new connections on its next use.
+    """
+    _flush_live_trackers()
+    _session.close()
+
+
+def _flush_live_trackers() -> None:
+    """Flush queued events of every tracker before the interpreter exits."""
+    for tracker in list(_live_trackers):
+        try:
+            tracker.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush usage events at exit: {e}")
+
+
+def _reinit_after_fork() -> None:
+    """
+    Reset process-wide tracking state in a forked child.
+
+    The child inherits the parent's pool, connections, locks and queued
+    events, but none of the threads behind them. It gets its own pool and
+    session, and each tracker starts with fresh locks and an empty queue;
+    events queued before the fork are the parent's to send.
+    """
+    global _session, _TRACK_POOL
+    _session = _new_session()
+    _TRACK_POOL = _new_pool()
+    for tracker in list(_live_trackers):
+        tracker._queue_lock = threading.Lock()
+        tracker._flush_lock = threading.Lock()
+        tracker._flush_scheduled = False
+        tracker._queue.clear()
+
+
+def _begin_exit() -> None:
+    """Start the exit deadline for sending queued events."""
+    global _exit_deadline
+    if _exit_deadline is None:
+        _exit_deadline = time.monotonic() + _EXIT_FLUSH_TIMEOUT
+
+
+def _shutdown() -> None:
+    """Flush queued events and stop the worker pool at interpreter exit."""
+    _begin_exit()
+    _flush_live_trackers()
+    _TRACK_POOL.shutdown(wait=True)
+
+
+# Python joins the pool's worker threads before atexit handlers run, so
+# start the deadline from the same hook concurrent.futures uses; it runs
+# before the pool's own, which registered first
+_register_thread_atexit = getattr(threading, "_register_atexit", None)
+if _register_thread_atexit is not None:
+    _register_thread_atexit(_begin_exit)
+atexit.register(_shutdown)
+
+# Forked workers (gunicorn --preload, celery prefork) need their own pool
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reinit_after_fork)
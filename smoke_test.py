@@ -8,7 +8,7 @@ import os
 import sys
 import time
 from datetime import datetime
-from unittest.mock import Mock
+from types import SimpleNamespace
 
 from cmdrdata import track_ai, CmdrData, customer_context, metadata_context
 
@@ -29,7 +29,7 @@ def run_smoke_test():
             def generate(self, prompt):
                 return {
                     "text": "response",
-                    "usage": Mock(prompt_tokens=10, completion_tokens=20, total_tokens=30)
+                    "usage": SimpleNamespace(prompt_tokens=10, completion_tokens=20, total_tokens=30)
                 }
         
         client = track_ai(
@@ -110,31 +110,31 @@ def run_smoke_test():
     # Test 5: Usage extraction
     print("\n[5/5] Testing usage extraction...")
     try:
-        # Test different response formats
+        # Test different response formats with plain objects, as real SDKs return
         wrapper = CmdrData(
-            client=Mock(),
+            client=SimpleNamespace(),
             cmdrdata_api_key="test",
             disable_tracking=True
         )
         
         # OpenAI format
-        response1 = Mock(spec=['usage'])
-        response1.usage = Mock(
-            spec=['prompt_tokens', 'completion_tokens', 'total_tokens'],
-            prompt_tokens=10,
-            completion_tokens=20,
-            total_tokens=30
+        response1 = SimpleNamespace(
+            usage=SimpleNamespace(
+                prompt_tokens=10,
+                completion_tokens=20,
+                total_tokens=30
+            )
         )
         usage1 = wrapper._CmdrData__extract_usage(response1)
         assert usage1["input_tokens"] == 10
         assert usage1["output_tokens"] == 20
         
         # Anthropic format
-        response2 = Mock(spec=['usage'])
-        response2.usage = Mock(
-            spec=['input_tokens', 'output_tokens'],
-            input_tokens=15,
-            output_tokens=25
+        response2 = SimpleNamespace(
+            usage=SimpleNamespace(
+                input_tokens=15,
+                output_tokens=25
+            )
         )
         usage2 = wrapper._CmdrData__extract_usage(response2)
         assert usage2["input_tokens"] == 15
@@ -0,0 +1,292 @@
+"""
+Shared fixtures for CmdrData SDK tests
+
+Provider clients are built once per session so tests that hit real APIs
+reuse the same HTTP connection pools. Each fixture returns None when the
+provider's API key is not set or its SDK is not installed; tests skip
+themselves in that case. Provider SDKs are only imported once a key is
+found, so unconfigured providers cost nothing.
+
+The E2E provider tests record their results as test properties. The
+hooks below collect them, on the xdist controller when running with -n.
+Each result is appended to e2e_results.jsonl as soon as its test finishes,
+so a crashed run keeps partial output; the first result of a session
+replaces the previous run's file. One summary is written to
+e2e_results.json at the end of the session. Pass
+--e2e-results-format=gzip to write e2e_results.json.gz instead, or
+--e2e-results-format=parquet (needs pyarrow) to write the per-provider
+rows to e2e_results.parquet for aggregation across runs.
+"""
+
+import gzip
+import importlib.util
+import json
+import os
+from collections import defaultdict
+from datetime import datetime
+
+import pytest
+
+from cmdrdata import CmdrData
+
+try:
+    import orjson
+
+    def _dump_results(data):
+        """Serialize the E2E summary to indented JSON bytes"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # orjson is an optional speedup
+
+    def _dump_results(data):
+        """Serialize the E2E summary to indented JSON bytes"""
+        return json.dumps(data, indent=2, default=datetime.isoformat).encode()
+
+
+_E2E_RESULTS_FILE = "e2e_results.json"
+_E2E_STREAM_FILE = "e2e_results.jsonl"
+_E2E_PARQUET_FILE = "e2e_results.parquet"
+_E2E_PARQUET_COLUMNS = ("provider", "status", "tokens", "customer_id", "error")
+_E2E_RUN_ID = pytest.StashKey[str]()
+_E2E_RESULTS = pytest.StashKey[list]()
+
+
+class _E2EResultCollector:
+    """Collect results recorded by the E2E tests from their reports"""
+
+    def __init__(self, test_run_id, results):
+        self.test_run_id = test_run_id
+        self.results = results
+        # The first result of the session replaces the previous run's file
+        self._stream_mode = "w"
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "call":
+            return
+        for name, value in report.user_properties:
+            if name == "e2e_result":
+                self.results.append(value)
+                self._stream(value)
+
+    def _stream(self, result):
+        """Append one result to the line-delimited results file"""
+        line = json.dumps({"test_run_id": self.test_run_id, **result})
+        with open(_E2E_STREAM_FILE, self._stream_mode) as f:
+            f.write(line + "\n")
+        self._stream_mode = "a"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--e2e-results-format",
+        choices=("json", "gzip", "parquet"),
+        default="json",
+        help="Format of the E2E results summary file (default: json)",
+    )
+
+
+def pytest_configure(config):
+    if (
+        config.getoption("e2e_results_format") == "parquet"
+        and importlib.util.find_spec("pyarrow") is None
+    ):
+        raise pytest.UsageError("--e2e-results-format=parquet requires pyarrow")
+
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None:
+        # xdist worker: results are reported back to the controller
+        config.stash[_E2E_RUN_ID] = workerinput["e2e_run_id"]
+        return
+
+    run_id = os.getenv("GITHUB_RUN_ID") or datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+    config.stash[_E2E_RUN_ID] = f"e2e-{run_id}"
+    config.stash[_E2E_RESULTS] = []
+    config.pluginmanager.register(
+        _E2EResultCollector(config.stash[_E2E_RUN_ID], config.stash[_E2E_RESULTS]),
+        "e2e-results",
+    )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Give xdist workers the controller's run ID"""
+    node.workerinput["e2e_run_id"] = node.config.stash[_E2E_RUN_ID]
+
+
+def pytest_sessionfinish(session):
+    results = session.config.stash.get(_E2E_RESULTS, None)
+    if not results:
+        return
+
+    test_run_id = session.config.stash[_E2E_RUN_ID]
+    buckets = _bucket_results(results)
+    _print_e2e_summary(results, buckets)
+    _save_e2e_results(
+        test_run_id, results, buckets, session.config.getoption("e2e_results_format")
+    )
+
+
+def _bucket_results(results):
+    """Group E2E results by status in a single pass"""
+    buckets = defaultdict(list)
+    for r in results:
+        buckets[r["status"]].append(r)
+    return buckets
+
+
+def _print_e2e_summary(results, buckets):
+    """Print E2E test summary"""
+    successful = buckets["success"]
+    failed = buckets["error"]
+    skipped = buckets["skipped"]
+
+    lines = [f"\n{'='*50}", "E2E TEST SUMMARY", "=" * 50]
+
+    lines.append(f"[OK] Successful: {len(successful)}/{len(results)}")
+    lines.extend(
+        f"  - {r['provider']}: {r.get('tokens', 0)} tokens" for r in successful
+    )
+
+    if failed:
+        lines.append(f"[ERROR] Failed: {len(failed)}")
+        lines.extend(
+            f"  - {r['provider']}: {r.get('error', 'Unknown')}" for r in failed
+        )
+
+    if skipped:
+        lines.append(f"[SKIP] Skipped: {len(skipped)}")
+        lines.extend(f"  - {r['provider']}" for r in skipped)
+
+    print("\n".join(lines))
+
+
+def _save_e2e_results(test_run_id, results, buckets, results_format="json"):
+    """Save E2E test results as JSON, gzipped JSON or Parquet"""
+    successful = buckets["success"]
+    failed = buckets["error"]
+    skipped = buckets["skipped"]
+
+    results_data = {
+        "test_run_id": test_run_id,
+        "timestamp": datetime.now(),
+        "results": results,
+        "summary": {
+            "total": len(results),
+            "successful": len(successful),
+            "failed": len(failed),
+            "skipped": len(skipped),
+        },
+    }
+
+    if results_format == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        # Fixed columns, since skipped and failed results omit some fields
+        table = pa.table(
+            {
+                "test_run_id": [test_run_id] * len(results),
+                **{c: [r.get(c) for r in results] for c in _E2E_PARQUET_COLUMNS},
+            }
+        )
+        results_file = _E2E_PARQUET_FILE
+        pq.write_table(table, results_file)
+    elif results_format == "gzip":
+        results_file = _E2E_RESULTS_FILE + ".gz"
+        with gzip.open(results_file, "wb", compresslevel=6) as f:
+            f.write(_dump_results(results_data))
+    else:
+        results_file = _E2E_RESULTS_FILE
+        with open(results_file, "wb") as f:
+            f.write(_dump_results(results_data))
+
+    print(f"\n[INFO] Results saved to {results_file}")
+    print(f"[INFO] Test Run ID: {test_run_id}")
+
+
+def _provider_key(env_var, module):
+    """Return the API key in env_var if module is installed, else None"""
+    key = os.getenv(env_var)
+    if not key:
+        return None
+    try:
+        if importlib.util.find_spec(module) is None:
+            return None
+    except ModuleNotFoundError:
+        # Parent package of a dotted module name is missing
+        return None
+    return key
+
+
+@pytest.fixture(scope="session")
+def e2e_run_id(pytestconfig):
+    """Run ID shared by every E2E test in the session"""
+    return pytestconfig.stash[_E2E_RUN_ID]
+
+
+@pytest.fixture(scope="module")
+def cmdrdata_factory():
+    """
+    Build CmdrData wrappers for the module's tests.
+
+    The wrappers share the SDK's cached tracker for the key, which also
+    honors CMDRDATA_URL.
+    """
+    api_key = os.getenv("CMDRDATA_API_KEY", "test-key")
+
+    def make(client, **kwargs):
+        return CmdrData(client=client, cmdrdata_api_key=api_key, **kwargs)
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def openai_client():
+    """OpenAI client, or None without OPENAI_API_KEY"""
+    key = _provider_key("OPENAI_API_KEY", "openai")
+    if not key:
+        return None
+    from openai import OpenAI
+
+    return OpenAI(api_key=key)
+
+
+@pytest.fixture(scope="session")
+def anthropic_client():
+    """Anthropic client, or None without ANTHROPIC_API_KEY"""
+    key = _provider_key("ANTHROPIC_API_KEY", "anthropic")
+    if not key:
+        return None
+    from anthropic import Anthropic
+
+    return Anthropic(api_key=key)
+
+
+@pytest.fixture(scope="session")
+def google_client():
+    """Google Generative AI model, or None without GOOGLE_API_KEY"""
+    key = _provider_key("GOOGLE_API_KEY", "google.generativeai")
+    if not key:
+        return None
+    import google.generativeai as genai
+
+    genai.configure(api_key=key)
+    return genai.GenerativeModel("gemini-1.5-flash")
+
+
+@pytest.fixture(scope="session")
+def cohere_client():
+    """
+    Cohere client and whether it is the V2 client.
+
+    Returns (None, False) without COHERE_API_KEY.
+    """
+    key = _provider_key("COHERE_API_KEY", "cohere")
+    if not key:
+        return None, False
+    import cohere
+
+    try:
+        return cohere.ClientV2(api_key=key), True
+    except:
+        return cohere.Client(api_key=key), False
@@ -18,12 +18,13 @@ import sys
 import time
 import unittest
 from datetime import datetime
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, Mock
 
 # Add parent to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from cmdrdata import CmdrData
+from cmdrdata import CmdrData, InMemoryTracker
+from cmdrdata.client import _detect_provider
 
 
 class TestProviderIntegration(unittest.TestCase):
@@ -39,16 +40,12 @@ class TestProviderIntegration(unittest.TestCase):
 
         self.test_customer_id = "test-customer"
         self.test_metadata = {"test": True, "suite": "integration"}
-        # Mock the tracker to prevent actual API calls
-        self.tracker_patch = patch("cmdrdata.client.UsageTracker")
-        self.mock_tracker_class = self.tracker_patch.start()
-        self.mock_tracker = Mock()
-        self.mock_tracker.track_usage_background = Mock()
-        self.mock_tracker_class.return_value = self.mock_tracker
+        # Record events in memory to prevent actual API calls
+        self.tracker = InMemoryTracker()
 
     def tearDown(self):
         """Clean up"""
-        self.tracker_patch.stop()
+        _detect_provider.cache_clear()
 
     def test_openai_integration(self):
         """Test OpenAI client integration"""
@@ -81,7 +78,10 @@ class TestProviderIntegration(unittest.TestCase):
 
         # Wrap with CmdrData
         client = CmdrData(
-            client=mock_openai, cmdrdata_api_key="test-key", provider="openai"
+            client=mock_openai,
+            cmdrdata_api_key="test-key",
+            provider="openai",
+            tracker=self.tracker,
         )
 
         # Make a tracked call
@@ -96,10 +96,10 @@ class TestProviderIntegration(unittest.TestCase):
         self.assertEqual(response, mock_response)
 
         # Verify tracking was called
-        self.mock_tracker.track_usage_background.assert_called_once()
+        self.assertEqual(len(self.tracker.events), 1)
 
         # Check tracked data
-        tracked_data = self.mock_tracker.track_usage_background.call_args[1]
+        tracked_data = self.tracker.events[-1]
         self.assertEqual(tracked_data["customer_id"], self.test_customer_id)
         self.assertEqual(tracked_data["input_tokens"], 10)
         self.assertEqual(tracked_data["output_tokens"], 20)
@@ -132,7 +132,10 @@ class TestProviderIntegration(unittest.TestCase):
 
         # Wrap with CmdrData
         client = CmdrData(
-            client=mock_anthropic, cmdrdata_api_key="test-key", provider="anthropic"
+            client=mock_anthropic,
+            cmdrdata_api_key="test-key",
+            provider="anthropic",
+            tracker=self.tracker,
         )
 
         # Make a tracked call
@@ -148,10 +151,10 @@ class TestProviderIntegration(unittest.TestCase):
         self.assertEqual(response, mock_response)
 
         # Verify tracking was called
-        self.mock_tracker.track_usage_background.assert_called_once()
+        self.assertEqual(len(self.tracker.events), 1)
 
         # Check tracked data
-        tracked_data = self.mock_tracker.track_usage_background.call_args[1]
+        tracked_data = self.tracker.events[-1]
         self.assertEqual(tracked_data["customer_id"], self.test_customer_id)
         self.assertEqual(tracked_data["input_tokens"], 15)
         self.assertEqual(tracked_data["output_tokens"], 25)
@@ -187,7 +190,10 @@ class TestProviderIntegration(unittest.TestCase):
 
         # Wrap with CmdrData
         client = CmdrData(
-            client=mock_cohere, cmdrdata_api_key="test-key", provider="cohere"
+            client=mock_cohere,
+            cmdrdata_api_key="test-key",
+            provider="cohere",
+            tracker=self.tracker,
         )
 
         # Make a tracked call
@@ -202,10 +208,10 @@ class TestProviderIntegration(unittest.TestCase):
         self.assertEqual(response, mock_response)
 
         # Verify tracking was called
-        self.mock_tracker.track_usage_background.assert_called_once()
+        self.assertEqual(len(self.tracker.events), 1)
 
         # Check tracked data
-        tracked_data = self.mock_tracker.track_usage_background.call_args[1]
+        tracked_data = self.tracker.events[-1]
         self.assertEqual(tracked_data["customer_id"], self.test_customer_id)
         self.assertEqual(tracked_data["input_tokens"], 5)  # Uses billed_units
         self.assertEqual(tracked_data["output_tokens"], 10)
@@ -234,7 +240,10 @@ class TestProviderIntegration(unittest.TestCase):
 
         # Wrap with CmdrData
         client = CmdrData(
-            client=mock_model, cmdrdata_api_key="test-key", provider="google"
+            client=mock_model,
+            cmdrdata_api_key="test-key",
+            provider="google",
+            tracker=self.tracker,
         )
 
         # Make a tracked call
@@ -246,10 +255,10 @@ class TestProviderIntegration(unittest.TestCase):
         self.assertEqual(response, mock_response)
 
         # Verify tracking was called
-        self.mock_tracker.track_usage_background.assert_called_once()
+        self.assertEqual(len(self.tracker.events), 1)
 
         # Check tracked data
-        tracked_data = self.mock_tracker.track_usage_background.call_args[1]
+        tracked_data = self.tracker.events[-1]
         self.assertEqual(tracked_data["customer_id"], self.test_customer_id)
         self.assertEqual(tracked_data["input_tokens"], 12)
         self.assertEqual(tracked_data["output_tokens"], 18)
@@ -276,6 +285,7 @@ class TestProviderIntegration(unittest.TestCase):
                 client=mock_client,
                 cmdrdata_api_key="test-key",
                 auto_detect_provider=True,
+                tracker=self.tracker,
             )
 
             self.assertEqual(
@@ -304,7 +314,9 @@ class TestProviderIntegration(unittest.TestCase):
         mock_client = MockFailingClient()
 
         # Wrap with CmdrData
-        client = CmdrData(client=mock_client, cmdrdata_api_key="test-key")
+        client = CmdrData(
+            client=mock_client, cmdrdata_api_key="test-key", tracker=self.tracker
+        )
 
         # Make a call that will error
         with self.assertRaises(Exception) as context:
@@ -317,10 +329,10 @@ class TestProviderIntegration(unittest.TestCase):
         self.assertEqual(str(context.exception), "API Error")
 
         # Verify error tracking was called
-        self.mock_tracker.track_usage_background.assert_called_once()
+        self.assertEqual(len(self.tracker.events), 1)
 
         # Check error was tracked
-        tracked_data = self.mock_tracker.track_usage_background.call_args[1]
+        tracked_data = self.tracker.events[-1]
         self.assertTrue(tracked_data["error_occurred"])
         self.assertEqual(tracked_data["error_type"], "Exception")
         self.assertEqual(tracked_data["error_message"], "API Error")
@@ -340,13 +352,15 @@ class TestProviderIntegration(unittest.TestCase):
         mock_client.complete = mock_method
 
         # Wrap with CmdrData
-        client = CmdrData(client=mock_client, cmdrdata_api_key="test-key")
+        client = CmdrData(
+            client=mock_client, cmdrdata_api_key="test-key", tracker=self.tracker
+        )
 
         # Call without explicit customer_id
         client.complete("test")
 
         # Verify context was used
-        tracked_data = self.mock_tracker.track_usage_background.call_args[1]
+        tracked_data = self.tracker.events[-1]
         self.assertEqual(tracked_data["customer_id"], "context-customer")
         self.assertEqual(tracked_data["metadata"]["from"], "context")
 
@@ -368,6 +382,7 @@ class TestProviderIntegration(unittest.TestCase):
             client=mock_client,
             cmdrdata_api_key="test-key",
             metadata={"source": "default", "type": "test"},
+            tracker=self.tracker,
         )
 
         # Call with call-specific metadata
@@ -376,7 +391,7 @@ class TestProviderIntegration(unittest.TestCase):
         )
 
         # Verify metadata was merged correctly (call > context > default)
-        tracked_data = self.mock_tracker.track_usage_background.call_args[1]
+        tracked_data = self.tracker.events[-1]
         self.assertEqual(tracked_data["metadata"]["source"], "call")  # Call overrides
         self.assertEqual(tracked_data["metadata"]["level"], 1)  # From context
         self.assertEqual(tracked_data["metadata"]["type"], "test")  # From default
@@ -4,6 +4,7 @@ Comprehensive test suite for CmdrData SDK with near 100% coverage
 Includes unit tests, integration tests, error handling, and edge cases
 """
 
+import asyncio
 import json
 import os
 import sys
@@ -22,7 +23,8 @@ from hypothesis import strategies as st
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from cmdrdata import CmdrData, customer_context, metadata_context, track_ai
-from cmdrdata.client import CmdrDataProxy
+from cmdrdata.cache import MemoryBackend
+from cmdrdata.client import CmdrDataProxy, _detect_provider
 from cmdrdata.context import (
     clear_customer_context,
     clear_metadata_context,
@@ -39,7 +41,7 @@ from cmdrdata.exceptions import (
     TrackingError,
     ValidationError,
 )
-from cmdrdata.tracker import UsageTracker
+from cmdrdata.tracker import InMemoryTracker, UsageTracker
 
 
 class TestCmdrDataInitialization:
@@ -114,6 +116,57 @@ class TestCmdrDataInitialization:
             assert wrapper._tracking_enabled is False
             assert wrapper.tracker.disabled is True
 
+    def test_wrappers_share_tracker(self):
+        """Test wrappers with the same configuration reuse one tracker"""
+        wrapper1 = CmdrData(client=Mock(), cmdrdata_api_key="shared-key")
+        wrapper2 = CmdrData(client=Mock(), cmdrdata_api_key="shared-key")
+        wrapper3 = CmdrData(client=Mock(), cmdrdata_api_key="other-key")
+
+        assert wrapper1.tracker is wrapper2.tracker
+        assert wrapper1.tracker is not wrapper3.tracker
+
+        CmdrData.close_pool()
+        wrapper4 = CmdrData(client=Mock(), cmdrdata_api_key="shared-key")
+        assert wrapper4.tracker is not wrapper1.tracker
+
+    @patch("cmdrdata.tracker._session.post")
+    def test_tracker_rejected_key_not_shared(self, mock_post):
+        """Test a tracker disabled by a 401 isn't handed to new wrappers"""
+        mock_post.return_value.status_code = 401
+
+        wrapper1 = CmdrData(client=Mock(), cmdrdata_api_key="revoked-key")
+        wrapper1.tracker.track_usage(customer_id="customer-123")
+        assert wrapper1.tracker.disabled is True
+
+        mock_post.return_value.status_code = 200
+        wrapper2 = CmdrData(client=Mock(), cmdrdata_api_key="revoked-key")
+
+        assert wrapper2.tracker is not wrapper1.tracker
+        assert wrapper2.tracker.disabled is False
+        assert wrapper2.tracker.track_usage(customer_id="customer-123") is True
+        wrapper3 = CmdrData(client=Mock(), cmdrdata_api_key="revoked-key")
+        assert wrapper3.tracker is wrapper2.tracker
+
+    def test_init_with_injected_tracker(self):
+        """Test a custom tracker receives events without an API key"""
+
+        class MockClient:
+            def generate(self, prompt: str) -> Dict[str, Any]:
+                return {"usage": {"input_tokens": 2, "output_tokens": 3}}
+
+        tracker = InMemoryTracker()
+        with patch.dict(os.environ, {}, clear=True):
+            wrapper = CmdrData(client=MockClient(), tracker=tracker)
+
+        wrapper.generate("test", customer_id="customer-1")
+
+        assert wrapper.tracker is tracker
+        assert len(tracker.events) == 1
+        assert tracker.events[0]["customer_id"] == "customer-1"
+        assert tracker.events[0]["total_tokens"] == 5
+        # Calls without metadata still pass a dict
+        assert tracker.events[0]["metadata"] == {}
+
     def test_init_with_custom_metadata(self):
         """Test initialization with default metadata"""
         mock_client = Mock()
@@ -147,6 +200,11 @@ class TestProviderDetection:
             ("replicate", "Client", "replicate"),
             ("together", "Together", "together"),
             ("perplexity", "Client", "perplexity"),
+            ("google.cloud.aiplatform", "PredictionServiceClient", "google"),
+            ("vertexai.generative_models", "GenerativeModel", "google"),
+            ("mistralai.client", "Mistral", "mistral"),
+            ("langchain_openai.chat_models", "ChatOpenAI", "openai"),
+            ("myapp.openai_helpers", "Helper", "unknown"),
             ("unknown.module", "CustomClient", "unknown"),
         ],
     )
@@ -165,6 +223,25 @@ class TestProviderDetection:
 
         assert wrapper.provider == expected
 
+    def test_provider_detection_cached_per_class(self):
+        """Test detection runs once per client class"""
+
+        class MockClient:
+            pass
+
+        MockClient.__module__ = "anthropic.client"
+        _detect_provider.cache_clear()
+
+        for _ in range(3):
+            wrapper = CmdrData(
+                client=MockClient(), cmdrdata_api_key="test", disable_tracking=True
+            )
+            assert wrapper.provider == "anthropic"
+
+        info = _detect_provider.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
     def test_manual_provider_override(self):
         """Test manual provider override"""
 
@@ -245,6 +322,80 @@ class TestMethodWrapping:
         # Should be the same wrapped instance
         assert method1 is method2
 
+    def test_nested_attribute_caching(self):
+        """Test that nested proxies and their methods are cached"""
+
+        class Completions:
+            def create(self, **kwargs):
+                return {"response": "test"}
+
+        class Chat:
+            def __init__(self):
+                self.completions = Completions()
+
+        class MockClient:
+            def __init__(self):
+                self.chat = Chat()
+
+        wrapper = CmdrData(
+            client=MockClient(), cmdrdata_api_key="test", disable_tracking=True
+        )
+
+        assert wrapper.chat.completions is wrapper.chat.completions
+        assert wrapper.chat.completions.create is wrapper.chat.completions.create
+
+        # Assigning through the proxy updates the client and drops the cache
+        new_completions = Completions()
+        wrapper.chat.completions = new_completions
+        assert wrapper._client.chat.completions is new_completions
+        assert wrapper.chat.completions._wrapped is new_completions
+
+    def test_wrapper_attribute_assignment_forwarded(self):
+        """Test the wrapper has no __dict__ and forwards unknown assignments"""
+
+        class MockClient:
+            timeout = 10
+
+            def generate(self, prompt: str):
+                return "first"
+
+        client = MockClient()
+        wrapper = CmdrData(
+            client=client, cmdrdata_api_key="test", disable_tracking=True
+        )
+
+        with pytest.raises(AttributeError):
+            object.__getattribute__(wrapper, "__dict__")
+
+        wrapper.timeout = 30
+        assert client.timeout == 30
+
+        wrapper.generate("test")
+        wrapper.generate = lambda prompt: "second"
+        assert wrapper.generate("test") == "second"
+
+    def test_wrapper_attribute_deletion_forwarded(self):
+        """Test deletions are forwarded so patch.object can restore methods"""
+
+        class MockClient:
+            def generate(self, prompt: str):
+                return "real"
+
+        client = MockClient()
+        wrapper = CmdrData(
+            client=client, cmdrdata_api_key="test", disable_tracking=True
+        )
+
+        assert wrapper.generate("test") == "real"
+        with patch.object(wrapper, "generate", return_value="mocked"):
+            assert wrapper.generate("test") == "mocked"
+        assert "generate" not in vars(client)
+        assert wrapper.generate("test") == "real"
+
+        wrapper.extra = 1
+        del wrapper.extra
+        assert not hasattr(client, "extra")
+
     def test_non_existent_attribute_error(self):
         """Test that accessing non-existent attributes raises AttributeError"""
         mock_client = Mock(spec=[])  # Empty spec
@@ -281,7 +432,7 @@ class TestUsageTracking:
         clear_customer_context()
         clear_metadata_context()
 
-    @patch("cmdrdata.tracker.requests.post")
+    @patch("cmdrdata.tracker._session.post")
     def test_successful_tracking(self, mock_post):
         """Test successful usage tracking"""
         mock_post.return_value.status_code = 200
@@ -314,7 +465,7 @@ class TestUsageTracking:
         assert call_args.kwargs["headers"]["Authorization"] == "Bearer test-key"
 
         # Check payload
-        payload = call_args.kwargs["json"]
+        payload = json.loads(call_args.kwargs["data"])
         assert payload["customer_id"] == "customer-123"
         assert payload["model"] == "test-model"
         assert payload["input_tokens"] == 10
@@ -390,6 +541,22 @@ class TestUsageTracking:
 
         tracker.track_usage_background.assert_not_called()
 
+    def test_tracking_disabled_strips_sdk_kwargs(self):
+        """Test calls written for a tracked client work with tracking disabled"""
+
+        class MockClient:
+            def generate(self, prompt: str) -> Dict[str, Any]:
+                return {"text": prompt}
+
+        wrapper = CmdrData(
+            client=MockClient(), cmdrdata_api_key="test-key", disable_tracking=True
+        )
+
+        result = wrapper.generate("test", customer_id="c-1", metadata={"a": 1})
+
+        assert result == {"text": "test"}
+        assert wrapper.provider == "unknown"
+
 
 class TestUsageExtraction:
     """Test usage information extraction from responses"""
@@ -465,6 +632,26 @@ class TestUsageExtraction:
         assert usage["output_tokens"] == 12
         assert usage["total_tokens"] == 20
 
+    def test_provider_extractor_falls_back_on_other_shapes(self):
+        """Test a provider's extractor handles responses in another format"""
+        response = Mock(spec=["usage"])
+        response.usage = Mock(
+            spec=["input_tokens", "output_tokens"], input_tokens=3, output_tokens=4
+        )
+
+        wrapper = CmdrData(
+            client=Mock(),
+            cmdrdata_api_key="test",
+            provider="openai",
+            disable_tracking=True,
+        )
+
+        usage = wrapper._CmdrData__extract_usage(response)
+
+        assert usage["input_tokens"] == 3
+        assert usage["output_tokens"] == 4
+        assert usage["total_tokens"] == 7
+
     def test_empty_response_extraction(self):
         """Test usage extraction from empty response"""
         wrapper = CmdrData(
@@ -555,6 +742,28 @@ class TestErrorHandling:
         assert call_kwargs["error_occurred"] is True
         assert call_kwargs["error_type"] == "ValueError"
         assert call_kwargs["error_message"] == "API Error"
+        assert "error_traceback" not in call_kwargs
+
+    def test_error_message_truncated_and_traceback_opt_in(self):
+        """Test long error messages are cut and tracebacks are opt-in"""
+        tracker = Mock()
+
+        class MockClient:
+            def generate(self, prompt: str):
+                raise RuntimeError("x" * 2000)
+
+        wrapper = CmdrData(
+            client=MockClient(), cmdrdata_api_key="test-key", capture_traceback=True
+        )
+        wrapper.tracker = tracker
+
+        with pytest.raises(RuntimeError):
+            wrapper.generate("test")
+
+        call_kwargs = tracker.track_usage_background.call_args.kwargs
+        assert call_kwargs["error_message"] == "x" * 512
+        assert call_kwargs["error_traceback"].startswith("Traceback")
+        assert "in generate" in call_kwargs["error_traceback"]
 
     def test_tracking_error_doesnt_break_call(self):
         """Test that tracking errors don't break the API call"""
@@ -566,13 +775,161 @@ class TestErrorHandling:
         wrapper = CmdrData(client=MockClient(), cmdrdata_api_key="test-key")
 
         # Make tracker's background tracking fail
-        wrapper.tracker.track_usage_background = Mock(
-            side_effect=Exception("Tracking failed")
+        with patch.object(
+            wrapper.tracker,
+            "track_usage_background",
+            side_effect=Exception("Tracking failed"),
+        ):
+            # Should still work despite tracking failure
+            result = wrapper.generate("test")
+            assert result["text"] == "success"
+
+
+class TestResponseCache:
+    """Test the opt-in response cache"""
+
+    class CountingClient:
+        def __init__(self):
+            self.calls = 0
+
+        def generate(self, prompt: str, **kwargs) -> Dict[str, Any]:
+            self.calls += 1
+            return {
+                "text": f"response-{self.calls}",
+                "usage": {"prompt_tokens": 10, "completion_tokens": 5},
+            }
+
+    def make_wrapper(self, client):
+        wrapper = CmdrData(
+            client=client, cmdrdata_api_key="test-key", enable_response_cache=True
         )
+        wrapper.tracker = Mock()
+        return wrapper
 
-        # Should still work despite tracking failure
-        result = wrapper.generate("test")
-        assert result["text"] == "success"
+    def test_deterministic_call_served_from_cache(self):
+        """Test repeated temperature=0 calls skip the provider"""
+        client = self.CountingClient()
+        wrapper = self.make_wrapper(client)
+
+        first = wrapper.generate("hello", temperature=0)
+        second = wrapper.generate("hello", temperature=0, customer_id="other")
+
+        assert client.calls == 1
+        assert second is first
+
+        hit = wrapper.tracker.track_usage_background.call_args_list[1].kwargs
+        assert hit["cache_hit"] is True
+        assert hit["cached_tokens"] == 15
+        assert hit["total_tokens"] == 0
+        assert hit["customer_id"] == "other"
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"temperature": 0.7},
+            {"temperature": 0, "stream": True},
+            {"temperature": 0, "tools": [{"name": "lookup"}]},
+            {"temperature": 0, "callback": object()},
+        ],
+    )
+    def test_uncacheable_calls_always_hit_provider(self, kwargs):
+        """Test non-deterministic or unhashable calls are never cached"""
+        client = self.CountingClient()
+        wrapper = self.make_wrapper(client)
+
+        wrapper.generate("hello", **kwargs)
+        wrapper.generate("hello", **kwargs)
+
+        assert client.calls == 2
+
+    def test_cache_disabled_by_default(self):
+        """Test responses are not cached unless enabled"""
+        client = self.CountingClient()
+        wrapper = CmdrData(client=client, cmdrdata_api_key="test-key")
+        wrapper.tracker = Mock()
+
+        wrapper.generate("hello", temperature=0)
+        wrapper.generate("hello", temperature=0)
+
+        assert client.calls == 2
+
+    @pytest.mark.parametrize("failing_method", ["get", "set"])
+    def test_cache_backend_failure_does_not_fail_call(self, failing_method):
+        """Test a broken cache backend is bypassed, not raised to the caller"""
+
+        class BrokenBackend:
+            def get(self, key):
+                if failing_method == "get":
+                    raise ConnectionError("cache down")
+                return None
+
+            def set(self, key, value):
+                if failing_method == "set":
+                    raise ConnectionError("cache down")
+
+        client = self.CountingClient()
+        wrapper = CmdrData(
+            client=client,
+            cmdrdata_api_key="test-key",
+            enable_response_cache=True,
+            cache_backend=BrokenBackend(),
+        )
+        wrapper.tracker = Mock()
+
+        result = wrapper.generate("hello", temperature=0)
+
+        assert result["text"] == "response-1"
+        event = wrapper.tracker.track_usage_background.call_args.kwargs
+        assert not event.get("error_occurred")
+
+    def test_async_calls_not_cached(self):
+        """Test coroutines are never cached, so each await gets a fresh call"""
+
+        class AsyncClient:
+            def __init__(self):
+                self.calls = 0
+
+            async def generate(self, prompt: str, **kwargs):
+                self.calls += 1
+                return {"text": f"response-{self.calls}"}
+
+            def create(self, prompt: str, **kwargs):
+                # Returns an awaitable without being a coroutine function
+                return self.generate(prompt, **kwargs)
+
+        client = AsyncClient()
+        wrapper = self.make_wrapper(client)
+
+        async def main():
+            return [
+                await wrapper.generate("hello", temperature=0),
+                await wrapper.generate("hello", temperature=0),
+                await wrapper.create("hello", temperature=0),
+                await wrapper.create("hello", temperature=0),
+            ]
+
+        results = asyncio.run(main())
+
+        assert client.calls == 4
+        assert [r["text"] for r in results] == [
+            "response-1",
+            "response-2",
+            "response-3",
+            "response-4",
+        ]
+
+    def test_memory_backend_evicts_least_recently_used(self):
+        """Test MemoryBackend keeps at most max_entries responses"""
+        backend = MemoryBackend(max_entries=2)
+        backend.set("a", 1)
+        backend.set("b", 2)
+        backend.get("a")
+        backend.set("c", 3)
+
+        assert backend.get("a") == 1
+        assert backend.get("b") is None
+        assert backend.get("c") == 3
 
 
 class TestContextManagers:
@@ -642,6 +999,23 @@ class TestContextManagers:
         clear_metadata_context()
         assert get_metadata_context() == {}
 
+    def test_context_isolated_between_async_tasks(self):
+        """Test concurrent asyncio tasks each see their own context"""
+
+        async def handle(customer_id):
+            with customer_context(customer_id):
+                with metadata_context({"request": customer_id}):
+                    await asyncio.sleep(0)
+                    return get_customer_context(), get_metadata_context()
+
+        async def main():
+            return await asyncio.gather(*(handle(f"task-{i}") for i in range(3)))
+
+        results = asyncio.run(main())
+
+        assert results == [(f"task-{i}", {"request": f"task-{i}"}) for i in range(3)]
+        assert get_customer_context() is None
+
 
 class TestProxy:
     """Test CmdrDataProxy functionality"""
@@ -702,11 +1076,33 @@ class TestProxy:
 
         assert "object is not callable" in str(exc.value)
 
+    def test_proxy_attribute_deletion_forwarded(self):
+        """Test deletions through a proxy reach the nested object"""
+
+        class Completions:
+            def create(self):
+                return "real"
+
+        class MockClient:
+            def __init__(self):
+                self.completions = Completions()
+
+        client = MockClient()
+        wrapper = CmdrData(
+            client=client, cmdrdata_api_key="test", disable_tracking=True
+        )
+
+        assert wrapper.completions.create() == "real"
+        with patch.object(wrapper.completions, "create", return_value="mocked"):
+            assert wrapper.completions.create() == "mocked"
+        assert "create" not in vars(client.completions)
+        assert wrapper.completions.create() == "real"
+
 
 class TestTracker:
     """Test UsageTracker functionality"""
 
-    @patch("cmdrdata.tracker.requests.post")
+    @patch("cmdrdata.tracker._session.post")
     def test_tracker_successful_send(self, mock_post):
         """Test tracker successfully sends events"""
         mock_post.return_value.status_code = 200
@@ -725,7 +1121,7 @@ class TestTracker:
         assert result is True
         mock_post.assert_called_once()
 
-    @patch("cmdrdata.tracker.requests.post")
+    @patch("cmdrdata.tracker._session.post")
     def test_tracker_retry_on_500(self, mock_post):
         """Test tracker retries on 500 errors"""
         mock_post.side_effect = [
@@ -747,7 +1143,7 @@ class TestTracker:
         assert result is True
         assert mock_post.call_count == 3
 
-    @patch("cmdrdata.tracker.requests.post")
+    @patch("cmdrdata.tracker._session.post")
     def test_tracker_auth_error_disables(self, mock_post):
         """Test tracker disables on auth error"""
         mock_post.return_value.status_code = 401
@@ -765,7 +1161,7 @@ class TestTracker:
         assert result is False
         assert tracker.disabled is True
 
-    @patch("cmdrdata.tracker.requests.post")
+    @patch("cmdrdata.tracker._session.post")
     def test_tracker_timeout_retry(self, mock_post):
         """Test tracker retries on timeout"""
         import requests
@@ -812,6 +1208,195 @@ class TestTracker:
             total_tokens=30,
         )
 
+    @patch("cmdrdata.tracker._session.post")
+    def test_tracker_background_coalesces_queued_events(self, mock_post):
+        """Test events queued while a flush is pending are sent as one batch"""
+        mock_post.return_value.status_code = 200
+
+        tracker = UsageTracker(api_key="test-key")
+
+        # Hold the flush lock so the events pile up in the queue
+        with tracker._flush_lock:
+            for i in range(3):
+                tracker.track_usage_background(customer_id=f"customer-{i}")
+
+        tracker.flush()
+
+        mock_post.assert_called_once()
+        assert mock_post.call_args.args[0] == "https://api.cmdrdata.ai/api/events:batch"
+        payload = json.loads(mock_post.call_args.kwargs["data"])
+        assert [e["customer_id"] for e in payload] == [
+            "customer-0",
+            "customer-1",
+            "customer-2",
+        ]
+
+    @patch("cmdrdata.tracker._session.post")
+    def test_tracker_background_timestamp_is_enqueue_time(self, mock_post):
+        """Test queued events keep the time they were queued, not flushed"""
+        mock_post.return_value.status_code = 200
+
+        tracker = UsageTracker(api_key="test-key")
+
+        with tracker._flush_lock:
+            with patch(
+                "cmdrdata.tracker.time.time_ns", return_value=1_700_000_000 * 10**9
+            ):
+                tracker.track_usage_background(customer_id="customer-123")
+
+        tracker.flush()
+
+        payload = json.loads(mock_post.call_args.kwargs["data"])
+        assert payload["timestamp"] == "2023-11-14T22:13:20"
+
+    @patch("cmdrdata.tracker._session.post")
+    def test_tracker_batch_size_limit(self, mock_post):
+        """Test batches are split at max_batch_size"""
+        mock_post.return_value.status_code = 200
+
+        tracker = UsageTracker(api_key="test-key", max_batch_size=2)
+
+        with tracker._flush_lock:
+            for i in range(5):
+                tracker.track_usage_background(customer_id=f"customer-{i}")
+
+        tracker.flush()
+
+        payloads = [json.loads(c.kwargs["data"]) for c in mock_post.call_args_list]
+        assert [len(p) for p in payloads[:2]] == [2, 2]
+        # A lone trailing event goes to the single-event endpoint
+        assert mock_post.call_args_list[2].args[0] == tracker.endpoint
+        assert payloads[2]["customer_id"] == "customer-4"
+
+    @patch("cmdrdata.tracker._session.post")
+    def test_tracker_serializes_payload_as_json(self, mock_post):
+        """Test events are sent as compact JSON bytes"""
+        mock_post.return_value.status_code = 200
+
+        tracker = UsageTracker(api_key="test-key")
+        tracker.track_usage(customer_id="customer-123", metadata={"ids": [1, 2]})
+
+        body = mock_post.call_args.kwargs["data"]
+        assert isinstance(body, bytes)
+        assert b'"ids":[1,2]' in body
+        assert json.loads(body)["customer_id"] == "customer-123"
+
+    @patch("cmdrdata.tracker._session.post")
+    def test_tracker_unserializable_event_not_sent(self, mock_post):
+        """Test an event that can't be serialized is dropped, not retried"""
+        tracker = UsageTracker(api_key="test-key")
+
+        result = tracker.track_usage(customer_id="c", metadata={"obj": object()})
+
+        assert result is False
+        mock_post.assert_not_called()
+
+    @patch("cmdrdata.tracker._session.post")
+    def test_tracker_queue_drops_oldest_when_full(self, mock_post):
+        """Test a full background queue drops the oldest events"""
+        mock_post.return_value.status_code = 200
+
+        tracker = UsageTracker(api_key="test-key", max_queue_size=2)
+
+        with tracker._flush_lock:
+            for i in range(5):
+                tracker.track_usage_background(customer_id=f"customer-{i}")
+
+        tracker.flush()
+
+        assert tracker.dropped_events == 3
+        sent = [
+            e for c in mock_post.call_args_list for e in json.loads(c.kwargs["data"])
+        ]
+        assert [e["customer_id"] for e in sent] == ["customer-3", "customer-4"]
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_tracker_background_sends_after_fork(self):
+        """Test a forked child gets a working pool and fresh tracker state"""
+        import cmdrdata.tracker as tracker_module
+
+        tracker = UsageTracker(api_key="test-key")
+        tracker_module._live_trackers.add(tracker)
+
+        # As if the fork happened while the parent's flush was pending
+        with tracker._queue_lock:
+            tracker._flush_scheduled = True
+            tracker._queue.append((time.time_ns(), {"customer_id": "queued"}))
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                os.close(read_fd)
+                post = Mock(return_value=Mock(status_code=200))
+                tracker_module._session.post = post
+                tracker.track_usage_background(customer_id="child")
+
+                deadline = time.monotonic() + 5
+                while not post.called and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                payloads = [json.loads(c.kwargs["data"]) for c in post.call_args_list]
+                os.write(write_fd, json.dumps(payloads).encode())
+                status = 0
+            finally:
+                os._exit(status)
+
+        try:
+            os.close(write_fd)
+            with os.fdopen(read_fd, "rb") as f:
+                output = f.read()
+            _, status = os.waitpid(pid, 0)
+
+            assert os.waitstatus_to_exitcode(status) == 0
+            sent = json.loads(output)
+            assert [p["customer_id"] for p in sent] == ["child"]
+
+            # The parent's state is untouched
+            assert tracker._flush_scheduled is True
+            assert len(tracker._queue) == 1
+        finally:
+            with tracker._queue_lock:
+                tracker._flush_scheduled = False
+                tracker._queue.clear()
+
+    @patch("cmdrdata.tracker._session.post")
+    def test_tracker_exit_flush_single_attempt(self, mock_post, monkeypatch):
+        """Test requests made while exiting are not retried"""
+        import requests
+
+        mock_post.side_effect = requests.exceptions.Timeout()
+        monkeypatch.setattr("cmdrdata.tracker._exit_deadline", time.monotonic() + 60)
+
+        tracker = UsageTracker(api_key="test-key", timeout=5)
+
+        with tracker._flush_lock:
+            tracker.track_usage_background(customer_id="customer-123")
+
+        tracker.flush()
+
+        mock_post.assert_called_once()
+        assert mock_post.call_args.kwargs["timeout"] <= 5
+
+    @patch("cmdrdata.tracker._session.post")
+    def test_tracker_exit_flush_drops_events_past_deadline(
+        self, mock_post, monkeypatch
+    ):
+        """Test events still queued at the exit deadline are dropped"""
+        monkeypatch.setattr("cmdrdata.tracker._exit_deadline", time.monotonic())
+
+        tracker = UsageTracker(api_key="test-key")
+
+        with tracker._flush_lock:
+            for i in range(3):
+                tracker.track_usage_background(customer_id=f"customer-{i}")
+
+        tracker.flush()
+
+        mock_post.assert_not_called()
+        assert tracker.dropped_events == 3
+        assert not tracker._queue
+
 
 class TestMethodCollisions:
     """Test that double underscore prevents collisions"""
@@ -922,6 +1507,21 @@ class TestShouldTrackMethod:
         result = wrapper._CmdrData__should_track_method(method_name)
         assert result == should_track
 
+    def test_untracked_method_passes_through(self):
+        """Test untracked methods skip tracking but still drop SDK kwargs"""
+
+        class MockClient:
+            def configure(self, **kwargs):
+                return kwargs
+
+        wrapper = CmdrData(client=MockClient(), cmdrdata_api_key="test")
+        wrapper.tracker = Mock()
+
+        result = wrapper.configure(timeout=5, customer_id="c-1", metadata={"a": 1})
+
+        assert result == {"timeout": 5}
+        wrapper.tracker.track_usage_background.assert_not_called()
+
 
 class TestThreadSafety:
     """Test thread safety of context managers"""
@@ -3,214 +3,225 @@ End-to-End Provider Tests for CmdrData SDK
 
 This test suite runs comprehensive integration tests across all supported providers.
 It verifies that tracking works correctly across multiple providers in a single session.
+
+Each provider is its own test, so the network calls can run in parallel:
+
+    pytest -n 4 tests/test_e2e_providers.py
+
+Without xdist the calls are still made concurrently on a thread pool.
+
+Results from every provider are combined into e2e_results.json when the
+session finishes (see conftest.py).
 """
 
-import json
 import os
 import sys
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Tuple
 
 import pytest
 
 from cmdrdata import CmdrData
 
+CMDRDATA_KEY = os.getenv("CMDRDATA_API_KEY", "test-key")
 
-class TestE2EProviders:
-    """End-to-end tests across multiple providers"""
+PROMPT = [{"role": "user", "content": "Reply with 'OK'"}]
 
-    def setup_method(self):
-        """Setup test run ID and results tracking"""
-        self.test_run_id = f"e2e-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-        self.results = []
-
-    def _test_provider(self, provider_name, setup_func):
-        """Helper to test a single provider"""
-        try:
-            print(f"\n{'='*50}")
-            print(f"Testing {provider_name}")
-            print("=" * 50)
-
-            client = setup_func()
-            if not client:
-                print(f"[SKIP] {provider_name} - No API key")
-                return {"provider": provider_name, "status": "skipped"}
-
-            # Wrap with CmdrData
-            customer_id = f"{self.test_run_id}-{provider_name.lower()}"
-            wrapped = CmdrData(
-                client=client,
-                cmdrdata_api_key=os.getenv("CMDRDATA_API_KEY", "test-key"),
-                customer_id=customer_id,
-                metadata={
-                    "test_run": self.test_run_id,
-                    "provider": provider_name,
-                    "ci": True,
-                },
-            )
 
-            # Make minimal API call based on provider
-            tokens = 0
-            if provider_name == "OpenAI":
-                response = wrapped.chat.completions.create(
-                    model="gpt-3.5-turbo",
-                    messages=[{"role": "user", "content": "Reply with 'OK'"}],
-                    max_tokens=5,
-                )
-                tokens = response.usage.total_tokens
-
-            elif provider_name == "Anthropic":
-                response = wrapped.messages.create(
-                    model="claude-3-haiku-20240307",
-                    messages=[{"role": "user", "content": "Reply with 'OK'"}],
-                    max_tokens=5,
-                )
-                tokens = response.usage.input_tokens + response.usage.output_tokens
-
-            elif provider_name == "Google":
-                response = wrapped.generate_content("Reply with 'OK'")
-                tokens = response.usage_metadata.total_token_count
-
-            elif provider_name == "Cohere":
-                if hasattr(wrapped, "chat"):
-                    response = wrapped.chat(
-                        model="command-r",
-                        messages=[{"role": "user", "content": "Reply with 'OK'"}],
-                    )
-                else:
-                    response = wrapped.generate(
-                        prompt="Reply with 'OK'", model="command", max_tokens=5
-                    )
-                tokens = 10  # Approximate
-
-            print(f"[OK] {provider_name} - {tokens} tokens used")
-            return {
-                "provider": provider_name,
-                "status": "success",
-                "tokens": tokens,
-                "customer_id": customer_id,
-            }
-
-        except Exception as e:
-            print(f"[ERROR] {provider_name}: {e}")
-            return {"provider": provider_name, "status": "error", "error": str(e)}
-
-    def _setup_openai(self):
-        """Setup OpenAI client"""
-        key = os.getenv("OPENAI_API_KEY")
-        if not key:
-            return None
-        from openai import OpenAI
-
-        return OpenAI(api_key=key)
-
-    def _setup_anthropic(self):
-        """Setup Anthropic client"""
-        key = os.getenv("ANTHROPIC_API_KEY")
-        if not key:
-            return None
-        from anthropic import Anthropic
-
-        return Anthropic(api_key=key)
-
-    def _setup_google(self):
-        """Setup Google Generative AI client"""
-        key = os.getenv("GOOGLE_API_KEY")
-        if not key:
-            return None
-        import google.generativeai as genai
-
-        genai.configure(api_key=key)
-        return genai.GenerativeModel("gemini-1.5-flash")
-
-    def _setup_cohere(self):
-        """Setup Cohere client"""
-        key = os.getenv("COHERE_API_KEY")
-        if not key:
-            return None
-        import cohere
-
-        try:
-            return cohere.ClientV2(api_key=key)
-        except:
-            return cohere.Client(api_key=key)
+def _call_openai(wrapped):
+    response = wrapped.chat.completions.create(
+        model="gpt-3.5-turbo", messages=PROMPT, max_tokens=5
+    )
+    return response, response.usage.total_tokens
+
+
+def _call_anthropic(wrapped):
+    response = wrapped.messages.create(
+        model="claude-3-haiku-20240307", messages=PROMPT, max_tokens=5
+    )
+    return response, response.usage.input_tokens + response.usage.output_tokens
+
+
+def _call_google(wrapped):
+    response = wrapped.generate_content("Reply with 'OK'")
+    return response, response.usage_metadata.total_token_count
+
+
+def _call_cohere(wrapped, is_v2=False):
+    if is_v2:
+        response = wrapped.chat(model="command-r", messages=PROMPT)
+    else:
+        response = wrapped.generate(
+            prompt="Reply with 'OK'", model="command", max_tokens=5
+        )
+    return response, 10  # Approximate
+
+
+# Minimal API call for each provider, returning (response, token_count)
+PROVIDER_CALLS: Dict[str, Callable[..., Tuple[Any, int]]] = {
+    "OpenAI": _call_openai,
+    "Anthropic": _call_anthropic,
+    "Google": _call_google,
+    "Cohere": _call_cohere,
+}
 
-    @pytest.mark.integration
-    def test_all_providers_e2e(self):
-        """Test all providers in a single E2E flow"""
-        print(f"Starting E2E Test Run: {self.test_run_id}")
-
-        providers = [
-            ("OpenAI", self._setup_openai),
-            ("Anthropic", self._setup_anthropic),
-            ("Google", self._setup_google),
-            ("Cohere", self._setup_cohere),
-        ]
-
-        for name, setup in providers:
-            result = self._test_provider(name, setup)
-            self.results.append(result)
-
-        # Generate summary
-        self._print_summary()
-
-        # Save results to file
-        self._save_results()
-
-        # Check if any providers failed
-        failed = [r for r in self.results if r["status"] == "error"]
-        if failed:
-            pytest.fail(
-                f"Failed providers: {', '.join([r['provider'] for r in failed])}"
-            )
 
-    def _print_summary(self):
-        """Print test summary"""
+def _test_provider(provider_name, client, test_run_id, **call_kwargs):
+    """
+    Helper to test a single provider.
+
+    call_kwargs are passed on to the provider's entry in PROVIDER_CALLS.
+    """
+    try:
         print(f"\n{'='*50}")
-        print("E2E TEST SUMMARY")
+        print(f"Testing {provider_name}")
         print("=" * 50)
 
-        successful = [r for r in self.results if r["status"] == "success"]
-        failed = [r for r in self.results if r["status"] == "error"]
-        skipped = [r for r in self.results if r["status"] == "skipped"]
-
-        print(f"[OK] Successful: {len(successful)}/{len(self.results)}")
-        for r in successful:
-            print(f"  - {r['provider']}: {r.get('tokens', 0)} tokens")
-
-        if failed:
-            print(f"[ERROR] Failed: {len(failed)}")
-            for r in failed:
-                print(f"  - {r['provider']}: {r.get('error', 'Unknown')}")
-
-        if skipped:
-            print(f"[SKIP] Skipped: {len(skipped)}")
-            for r in skipped:
-                print(f"  - {r['provider']}")
-
-    def _save_results(self):
-        """Save test results to JSON file"""
-        results_file = "e2e_results.json"
-        successful = [r for r in self.results if r["status"] == "success"]
-        failed = [r for r in self.results if r["status"] == "error"]
-        skipped = [r for r in self.results if r["status"] == "skipped"]
-
-        results_data = {
-            "test_run_id": self.test_run_id,
-            "timestamp": datetime.now().isoformat(),
-            "results": self.results,
-            "summary": {
-                "total": len(self.results),
-                "successful": len(successful),
-                "failed": len(failed),
-                "skipped": len(skipped),
+        if not client:
+            print(f"[SKIP] {provider_name} - No API key")
+            return {"provider": provider_name, "status": "skipped"}
+
+        # Wrap with CmdrData
+        customer_id = f"{test_run_id}-{provider_name.lower()}"
+        wrapped = CmdrData(
+            client=client,
+            cmdrdata_api_key=CMDRDATA_KEY,
+            customer_id=customer_id,
+            metadata={
+                "test_run": test_run_id,
+                "provider": provider_name,
+                "ci": True,
             },
+        )
+
+        # Make minimal API call based on provider
+        response, tokens = PROVIDER_CALLS[provider_name](wrapped, **call_kwargs)
+
+        print(f"[OK] {provider_name} - {tokens} tokens used")
+        return {
+            "provider": provider_name,
+            "status": "success",
+            "tokens": tokens,
+            "customer_id": customer_id,
         }
 
-        with open(results_file, "w") as f:
-            json.dump(results_data, f, indent=2)
+    except Exception as e:
+        print(f"[ERROR] {provider_name}: {e}")
+        return {"provider": provider_name, "status": "error", "error": str(e)}
+
+
+# E2E test name -> (provider name, client fixture)
+E2E_TESTS = {
+    "test_openai_e2e": ("OpenAI", "openai_client"),
+    "test_anthropic_e2e": ("Anthropic", "anthropic_client"),
+    "test_google_e2e": ("Google", "google_client"),
+    "test_cohere_e2e": ("Cohere", "cohere_client"),
+}
+
+
+def _client_args(provider_name, fixture_value):
+    """Split a client fixture's value into the client and its call kwargs"""
+    if provider_name == "Cohere":
+        # cohere_client is a (client, is_v2) pair
+        client, is_v2 = fixture_value
+        return client, {"is_v2": is_v2}
+    return fixture_value, {}
+
+
+@pytest.fixture(scope="session")
+def provider_futures(request, e2e_run_id):
+    """
+    Start the API call of every selected provider test at once.
+
+    Without xdist the provider tests run one after another, so their
+    network calls are started together on a thread pool and each test
+    waits for its own result. Under xdist each worker makes its own call.
+    """
+    if hasattr(request.config, "workerinput"):
+        yield {}
+        return
+
+    selected = [
+        E2E_TESTS[item.originalname]
+        for item in request.session.items
+        if item.originalname in E2E_TESTS
+    ]
+    with ThreadPoolExecutor(max_workers=max(1, len(selected))) as executor:
+        futures = {}
+        for name, fixture in selected:
+            client, call_kwargs = _client_args(name, request.getfixturevalue(fixture))
+            futures[name] = executor.submit(
+                _test_provider, name, client, e2e_run_id, **call_kwargs
+            )
+        yield futures
+
+
+class TestE2EProviders:
+    """End-to-end tests across multiple providers"""
 
-        print(f"\n[INFO] Results saved to {results_file}")
-        print(f"[INFO] Test Run ID: {self.test_run_id}")
+    def _check_provider(
+        self,
+        provider_name,
+        client,
+        test_run_id,
+        provider_futures,
+        record_property,
+        **call_kwargs,
+    ):
+        """Run one provider and record its result for the session summary"""
+        future = provider_futures.get(provider_name)
+        if future is not None:
+            result = future.result()
+        else:
+            result = _test_provider(provider_name, client, test_run_id, **call_kwargs)
+        record_property("e2e_result", result)
+
+        if result["status"] == "skipped":
+            pytest.skip(f"{provider_name} - No API key")
+        if result["status"] == "error":
+            pytest.fail(f"{provider_name} failed: {result['error']}")
+
+    @pytest.mark.integration
+    def test_openai_e2e(
+        self, openai_client, e2e_run_id, provider_futures, record_property
+    ):
+        """Test OpenAI end to end"""
+        self._check_provider(
+            "OpenAI", openai_client, e2e_run_id, provider_futures, record_property
+        )
+
+    @pytest.mark.integration
+    def test_anthropic_e2e(
+        self, anthropic_client, e2e_run_id, provider_futures, record_property
+    ):
+        """Test Anthropic end to end"""
+        self._check_provider(
+            "Anthropic", anthropic_client, e2e_run_id, provider_futures, record_property
+        )
+
+    @pytest.mark.integration
+    def test_google_e2e(
+        self, google_client, e2e_run_id, provider_futures, record_property
+    ):
+        """Test Google end to end"""
+        self._check_provider(
+            "Google", google_client, e2e_run_id, provider_futures, record_property
+        )
+
+    @pytest.mark.integration
+    def test_cohere_e2e(
+        self, cohere_client, e2e_run_id, provider_futures, record_property
+    ):
+        """Test Cohere end to end"""
+        client, is_v2 = cohere_client
+        self._check_provider(
+            "Cohere",
+            client,
+            e2e_run_id,
+            provider_futures,
+            record_property,
+            is_v2=is_v2,
+        )
 
 
 if __name__ == "__main__":
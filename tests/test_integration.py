@@ -19,6 +19,12 @@ from cmdrdata import CmdrData, customer_context, metadata_context, track_ai
 from cmdrdata.tracker import UsageTracker
 
 
+def _as_events(data: bytes) -> List[Any]:
+    """Decode a single-event or batch request body to a list of events"""
+    payload = json.loads(data)
+    return payload if isinstance(payload, list) else [payload]
+
+
 class MockCmdrDataServer:
     """Mock CmdrData API server for testing"""
 
@@ -29,7 +35,9 @@ class MockCmdrDataServer:
         self.auth_tokens = {"test-api-key", "valid-key", "cmd-test-key"}
 
     def handle_request(
-        self, request_data: Dict[str, Any], headers: Dict[str, str]
+        self,
+        request_data: bytes,
+        headers: Dict[str, str],
     ) -> Dict[str, Any]:
         """Simulate CmdrData API handling"""
         # Check authentication
@@ -42,18 +50,21 @@ class MockCmdrDataServer:
             return {"status": 401, "error": "Invalid API key"}
 
         # Validate required fields
+        events = _as_events(request_data)
         required_fields = ["customer_id", "model", "provider"]
-        for field in required_fields:
-            if field not in request_data:
-                return {"status": 400, "error": f"Missing required field: {field}"}
-
-        # Store the event
-        event = {
-            **request_data,
-            "timestamp": datetime.utcnow().isoformat(),
-            "api_key": token,
-        }
-        self.received_events.append(event)
+        for event_data in events:
+            for field in required_fields:
+                if field not in event_data:
+                    return {"status": 400, "error": f"Missing required field: {field}"}
+
+        # Store the events
+        for event_data in events:
+            event = {
+                **event_data,
+                "timestamp": datetime.utcnow().isoformat(),
+                "api_key": token,
+            }
+            self.received_events.append(event)
 
         # Simulate delay if configured
         if self.response_delay > 0:
@@ -107,14 +118,14 @@ class TestIntegrationBasic:
         MockOpenAI.__module__ = "openai"
         return MockOpenAI
 
-    @patch("cmdrdata.tracker.requests.post")
+    @patch("cmdrdata.tracker._session.post")
     def test_basic_tracking_flow(self, mock_post, mock_server, mock_openai_client):
         """Test basic tracking flow with mock server"""
 
         # Configure mock to use our server
-        def post_handler(url, json=None, headers=None, timeout=None):
+        def post_handler(url, data=None, headers=None, timeout=None):
             response = Mock()
-            result = mock_server.handle_request(json, headers)
+            result = mock_server.handle_request(data, headers)
             response.status_code = result["status"]
             response.json.return_value = result
             return response
@@ -151,13 +162,13 @@ class TestIntegrationBasic:
         assert event["metadata"]["session"] == "abc"
         assert event["metadata"]["feature"] == "chat"
 
-    @patch("cmdrdata.tracker.requests.post")
+    @patch("cmdrdata.tracker._session.post")
     def test_multiple_providers(self, mock_post, mock_server):
         """Test tracking multiple AI providers"""
 
-        def post_handler(url, json=None, headers=None, timeout=None):
+        def post_handler(url, data=None, headers=None, timeout=None):
             response = Mock()
-            result = mock_server.handle_request(json, headers)
+            result = mock_server.handle_request(data, headers)
             response.status_code = result["status"]
             return response
 
@@ -210,13 +221,13 @@ class TestIntegrationBasic:
             assert event["customer_id"] == f"customer-{provider}"
             assert event["total_tokens"] == 30
 
-    @patch("cmdrdata.tracker.requests.post")
+    @patch("cmdrdata.tracker._session.post")
     def test_context_managers(self, mock_post, mock_server, mock_openai_client):
         """Test context managers for customer and metadata"""
 
-        def post_handler(url, json=None, headers=None, timeout=None):
+        def post_handler(url, data=None, headers=None, timeout=None):
             response = Mock()
-            result = mock_server.handle_request(json, headers)
+            result = mock_server.handle_request(data, headers)
             response.status_code = result["status"]
             response.json.return_value = result
             return response
@@ -270,13 +281,13 @@ class TestIntegrationBasic:
         assert mock_server.received_events[2]["metadata"]["level"] == "nested"
         assert mock_server.received_events[2]["metadata"]["additional"] == "data"
 
-    @patch("cmdrdata.tracker.requests.post")
+    @patch("cmdrdata.tracker._session.post")
     def test_error_tracking(self, mock_post, mock_server):
         """Test that errors are tracked properly"""
 
-        def post_handler(url, json=None, headers=None, timeout=None):
+        def post_handler(url, data=None, headers=None, timeout=None):
             response = Mock()
-            result = mock_server.handle_request(json, headers)
+            result = mock_server.handle_request(data, headers)
             response.status_code = result["status"]
             response.json.return_value = result
             return response
@@ -306,12 +317,12 @@ class TestIntegrationBasic:
         assert event["error_type"] == "ValueError"
         assert "Rate limit exceeded" in event["error_message"]
 
-    @patch("cmdrdata.tracker.requests.post")
+    @patch("cmdrdata.tracker._session.post")
     def test_retry_mechanism(self, mock_post, mock_server, mock_openai_client):
         """Test retry mechanism for failed requests"""
         call_count = [0]
 
-        def post_handler(url, json=None, headers=None, timeout=None):
+        def post_handler(url, data=None, headers=None, timeout=None):
             call_count[0] += 1
             response = Mock()
 
@@ -320,7 +331,7 @@ class TestIntegrationBasic:
                 response.status_code = 500
                 response.json.return_value = {"error": "Server error"}
             else:
-                result = mock_server.handle_request(json, headers)
+                result = mock_server.handle_request(data, headers)
                 response.status_code = result["status"]
                 response.json.return_value = result
 
@@ -352,13 +363,13 @@ class TestIntegrationBasic:
 class TestIntegrationRealProviders:
     """Integration tests with real provider response formats"""
 
-    @patch("cmdrdata.tracker.requests.post")
+    @patch("cmdrdata.tracker._session.post")
     def test_openai_response_format(self, mock_post):
         """Test with realistic OpenAI response format"""
         received_events = []
 
-        def capture_event(url, json=None, headers=None, timeout=None):
-            received_events.append(json)
+        def capture_event(url, data=None, headers=None, timeout=None):
+            received_events.extend(_as_events(data))
             response = Mock()
             response.status_code = 200
             return response
@@ -434,13 +445,13 @@ class TestIntegrationRealProviders:
         assert event["metadata"]["topic"] == "quantum"
         assert event["metadata"]["user_level"] == "beginner"
 
-    @patch("cmdrdata.tracker.requests.post")
+    @patch("cmdrdata.tracker._session.post")
     def test_anthropic_response_format(self, mock_post):
         """Test with realistic Anthropic response format"""
         received_events = []
 
-        def capture_event(url, json=None, headers=None, timeout=None):
-            received_events.append(json)
+        def capture_event(url, data=None, headers=None, timeout=None):
+            received_events.extend(_as_events(data))
             response = Mock()
             response.status_code = 200
             return response
@@ -508,13 +519,13 @@ class TestIntegrationRealProviders:
 class TestIntegrationPerformance:
     """Performance and reliability tests"""
 
-    @patch("cmdrdata.tracker.requests.post")
+    @patch("cmdrdata.tracker._session.post")
     def test_high_volume_tracking(self, mock_post):
         """Test tracking high volume of requests"""
         received_events = []
 
-        def capture_event(url, json=None, headers=None, timeout=None):
-            received_events.append(json)
+        def capture_event(url, data=None, headers=None, timeout=None):
+            received_events.extend(_as_events(data))
             response = Mock()
             response.status_code = 200
             return response
@@ -559,15 +570,15 @@ class TestIntegrationPerformance:
         for count in customer_counts.values():
             assert count == 10
 
-    @patch("cmdrdata.tracker.requests.post")
+    @patch("cmdrdata.tracker._session.post")
     def test_concurrent_tracking(self, mock_post):
         """Test concurrent tracking from multiple threads"""
         received_events = []
         lock = threading.Lock()
 
-        def capture_event(url, json=None, headers=None, timeout=None):
+        def capture_event(url, data=None, headers=None, timeout=None):
             with lock:
-                received_events.append(json)
+                received_events.extend(_as_events(data))
             response = Mock()
             response.status_code = 200
             return response
@@ -624,13 +635,13 @@ class TestIntegrationPerformance:
 class TestIntegrationEdgeCases:
     """Test edge cases and error conditions"""
 
-    @patch("cmdrdata.tracker.requests.post")
+    @patch("cmdrdata.tracker._session.post")
     def test_missing_usage_data(self, mock_post):
         """Test handling responses without usage data"""
         received_events = []
 
-        def capture_event(url, json=None, headers=None, timeout=None):
-            received_events.append(json)
+        def capture_event(url, data=None, headers=None, timeout=None):
+            received_events.extend(_as_events(data))
             response = Mock()
             response.status_code = 200
             return response
@@ -656,14 +667,14 @@ class TestIntegrationEdgeCases:
         assert event["output_tokens"] == 0
         assert event["total_tokens"] == 0
 
-    @patch("cmdrdata.tracker.requests.post")
+    @patch("cmdrdata.tracker._session.post")
     def test_network_timeout(self, mock_post):
         """Test handling network timeouts"""
         import requests
 
         call_count = [0]
 
-        def timeout_then_succeed(url, json=None, headers=None, timeout=None):
+        def timeout_then_succeed(url, data=None, headers=None, timeout=None):
             call_count[0] += 1
             if call_count[0] == 1:
                 raise requests.exceptions.Timeout("Connection timeout")
@@ -12,28 +12,30 @@ from unittest.mock import Mock
 
 import pytest
 
-from cmdrdata import CmdrData
+_GITHUB_RUN_ID = os.getenv("GITHUB_RUN_ID")
+GH_RUN = _GITHUB_RUN_ID or "local"
+
+# One ID per test run so all provider events can be correlated in CmdrData
+RUN_ID = _GITHUB_RUN_ID or datetime.utcnow().strftime("%Y%m%d-%H%M%S")
 
 
 class TestProviderIntegration:
     """Test individual provider integrations with CmdrData wrapper"""
 
-    @pytest.mark.skipif(not os.getenv("OPENAI_API_KEY"), reason="No OpenAI API key")
-    def test_openai_integration(self):
+    def test_openai_integration(self, openai_client, cmdrdata_factory):
         """Test OpenAI SDK integration"""
-        from openai import OpenAI
+        if openai_client is None:
+            pytest.skip("No OpenAI API key")
 
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        test_id = f"ci-test-openai-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        test_id = f"ci-test-openai-{RUN_ID}"
 
-        wrapped_client = CmdrData(
-            client=client,
-            cmdrdata_api_key=os.getenv("CMDRDATA_API_KEY", "test-key"),
+        wrapped_client = cmdrdata_factory(
+            openai_client,
             customer_id=test_id,
             metadata={
                 "test_type": "ci_integration",
                 "provider": "OpenAI",
-                "github_run_id": os.getenv("GITHUB_RUN_ID", "local"),
+                "github_run_id": GH_RUN,
             },
         )
 
@@ -48,24 +50,20 @@ class TestProviderIntegration:
         assert response.usage.total_tokens > 0
         print(f"[OK] OpenAI: {response.usage.total_tokens} tokens used")
 
-    @pytest.mark.skipif(
-        not os.getenv("ANTHROPIC_API_KEY"), reason="No Anthropic API key"
-    )
-    def test_anthropic_integration(self):
+    def test_anthropic_integration(self, anthropic_client, cmdrdata_factory):
         """Test Anthropic SDK integration"""
-        from anthropic import Anthropic
+        if anthropic_client is None:
+            pytest.skip("No Anthropic API key")
 
-        client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
-        test_id = f"ci-test-anthropic-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        test_id = f"ci-test-anthropic-{RUN_ID}"
 
-        wrapped_client = CmdrData(
-            client=client,
-            cmdrdata_api_key=os.getenv("CMDRDATA_API_KEY", "test-key"),
+        wrapped_client = cmdrdata_factory(
+            anthropic_client,
             customer_id=test_id,
             metadata={
                 "test_type": "ci_integration",
                 "provider": "Anthropic",
-                "github_run_id": os.getenv("GITHUB_RUN_ID", "local"),
+                "github_run_id": GH_RUN,
             },
         )
 
@@ -81,23 +79,20 @@ class TestProviderIntegration:
         assert total_tokens > 0
         print(f"[OK] Anthropic: {total_tokens} tokens used")
 
-    @pytest.mark.skipif(not os.getenv("GOOGLE_API_KEY"), reason="No Google API key")
-    def test_google_integration(self):
+    def test_google_integration(self, google_client, cmdrdata_factory):
         """Test Google Generative AI SDK integration"""
-        import google.generativeai as genai
+        if google_client is None:
+            pytest.skip("No Google API key")
 
-        genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-        client = genai.GenerativeModel("gemini-1.5-flash")
-        test_id = f"ci-test-google-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        test_id = f"ci-test-google-{RUN_ID}"
 
-        wrapped_client = CmdrData(
-            client=client,
-            cmdrdata_api_key=os.getenv("CMDRDATA_API_KEY", "test-key"),
+        wrapped_client = cmdrdata_factory(
+            google_client,
             customer_id=test_id,
             metadata={
                 "test_type": "ci_integration",
                 "provider": "Google",
-                "github_run_id": os.getenv("GITHUB_RUN_ID", "local"),
+                "github_run_id": GH_RUN,
             },
         )
 
@@ -108,35 +103,27 @@ class TestProviderIntegration:
         assert response.usage_metadata.total_token_count > 0
         print(f"[OK] Google: {response.usage_metadata.total_token_count} tokens used")
 
-    @pytest.mark.skipif(not os.getenv("COHERE_API_KEY"), reason="No Cohere API key")
-    def test_cohere_integration(self):
+    def test_cohere_integration(self, cohere_client, cmdrdata_factory):
         """Test Cohere SDK integration"""
-        import cohere
-
-        # Try both V2 and V1 clients
-        try:
-            client = cohere.ClientV2(api_key=os.getenv("COHERE_API_KEY"))
-            is_v2 = True
-        except:
-            client = cohere.Client(api_key=os.getenv("COHERE_API_KEY"))
-            is_v2 = False
+        client, is_v2 = cohere_client
+        if client is None:
+            pytest.skip("No Cohere API key")
 
-        test_id = f"ci-test-cohere-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        test_id = f"ci-test-cohere-{RUN_ID}"
 
-        wrapped_client = CmdrData(
-            client=client,
-            cmdrdata_api_key=os.getenv("CMDRDATA_API_KEY", "test-key"),
+        wrapped_client = cmdrdata_factory(
+            client,
             customer_id=test_id,
             metadata={
                 "test_type": "ci_integration",
                 "provider": "Cohere",
                 "version": "v2" if is_v2 else "v1",
-                "github_run_id": os.getenv("GITHUB_RUN_ID", "local"),
+                "github_run_id": GH_RUN,
             },
         )
 
         # Make a minimal API call based on client version
-        if is_v2 and hasattr(wrapped_client, "chat"):
+        if is_v2:
             response = wrapped_client.chat(
                 model="command-r", messages=[{"role": "user", "content": "Say 'OK'"}]
             )
@@ -2,17 +2,69 @@
 """
 Production validation for CmdrData SDK
 Comprehensive test to ensure SDK is ready for production
+
+The individual checks live in tests/test_production_readiness.py; this
+script runs them (in parallel when pytest-xdist is installed) together
+with the comprehensive test suite and prints the validation summary.
 """
 
+import contextlib
+import importlib.util
+import io
 import os
+import re
 import sys
-import time
-import json
 from datetime import datetime
-from unittest.mock import Mock
-import subprocess
 
-from cmdrdata import track_ai, CmdrData, customer_context, metadata_context
+import pytest
+
+CHECKS_MODULE = "tests/test_production_readiness.py"
+
+_PASSED_RE = re.compile(r"(\d+) passed")
+
+# Summary name for each check in CHECKS_MODULE, in report order
+CHECK_NAMES = {
+    "test_package_imports": "Package Imports",
+    "test_provider_detection": "Provider Detection",
+    "test_usage_extraction_patterns": "Usage Extraction",
+    "test_context_managers": "Context Managers",
+    "test_error_resilience": "Error Resilience",
+    "test_thread_safety": "Thread Safety",
+    "test_api_key_config": "API Key Config",
+}
+
+
+class _ValidationSummary:
+    """Collect check outcomes and print the validation summary table"""
+
+    def __init__(self, all_checks):
+        self.all_checks = all_checks
+        self.outcomes = {}
+
+    def pytest_runtest_logreport(self, report):
+        name = CHECK_NAMES.get(report.nodeid.rpartition("::")[2])
+        if name is None:
+            return
+        if report.failed:
+            self.outcomes[name] = False
+        elif report.when == "call":
+            self.outcomes.setdefault(name, report.passed)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        for name in CHECK_NAMES.values():
+            self.all_checks.append((name, self.outcomes.get(name, False)))
+
+        passed = sum(1 for _, success in self.all_checks if success)
+        total = len(self.all_checks)
+
+        terminalreporter.write_sep("=", "VALIDATION SUMMARY")
+        for check_name, success in self.all_checks:
+            status = "[PASS]" if success else "[FAIL]"
+            terminalreporter.write_line(f"  {status} {check_name}")
+
+        terminalreporter.write_line(f"\n  Total: {total} checks")
+        terminalreporter.write_line(f"  Passed: {passed}")
+        terminalreporter.write_line(f"  Failed: {total - passed}")
 
 
 def validate_production_readiness():
@@ -25,281 +77,63 @@ def validate_production_readiness():
     
     all_checks = []
     
-    # Check 1: Package imports
-    print("\n[CHECK 1] Package imports and dependencies...")
-    try:
-        import cmdrdata
-        from cmdrdata import track_ai, CmdrData
-        from cmdrdata.tracker import UsageTracker
-        from cmdrdata.context import customer_context, metadata_context
-        from cmdrdata.exceptions import CMDRDataError
-        print("  [OK] All core modules import successfully")
-        all_checks.append(("Package Imports", True))
-    except Exception as e:
-        print(f"  [FAIL] Import error: {e}")
-        all_checks.append(("Package Imports", False))
-        return False
-    
-    # Check 2: Test suite passes
-    print("\n[CHECK 2] Running test suite...")
-    try:
-        result = subprocess.run(
-            ["uv", "run", "pytest", "tests/test_comprehensive.py", "--tb=no", "-q"],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        if "passed" in result.stdout:
-            # Extract test count
-            import re
-            match = re.search(r'(\d+) passed', result.stdout)
-            if match:
-                test_count = match.group(1)
-                print(f"  [OK] {test_count} tests passed")
-                all_checks.append(("Test Suite", True))
-            else:
-                print("  [OK] Tests passed")
-                all_checks.append(("Test Suite", True))
-        else:
-            print(f"  [FAIL] Some tests failed")
-            print(f"       Output: {result.stdout}")
-            all_checks.append(("Test Suite", False))
-    except Exception as e:
-        print(f"  [FAIL] Test execution error: {e}")
-        all_checks.append(("Test Suite", False))
-    
-    # Check 3: Provider detection
-    print("\n[CHECK 3] Provider detection...")
-    try:
-        providers_tested = 0
-        providers = [
-            ("openai.client", "openai"),
-            ("anthropic.client", "anthropic"),
-            ("google.generativeai", "google"),
-            ("cohere.client", "cohere"),
-            ("huggingface_hub", "huggingface")
-        ]
-        
-        for module, expected in providers:
-            class TestClient:
-                pass
-            TestClient.__module__ = module
-            
-            wrapper = CmdrData(
-                client=TestClient(),
-                cmdrdata_api_key="test",
-                disable_tracking=True
-            )
+    # Test suite passes
+    print("\n[CHECK 1] Running test suite...")
+    if os.environ.get("PYTEST_CURRENT_TEST"):
+        # Running inside pytest already; the outer runner covers the suite
+        print("  [SKIP] Test suite (running under pytest)")
+        all_checks.append(("Test Suite", True))
+    else:
+        try:
+            # Run in-process so the already-imported SDK and pytest are reused
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                exit_code = pytest.main(["tests/test_comprehensive.py", "--tb=no", "-q"])
+            stdout = output.getvalue()
             
-            if wrapper.provider == expected:
-                providers_tested += 1
+            if exit_code == pytest.ExitCode.OK:
+                # Extract test count
+                match = _PASSED_RE.search(stdout)
+                if match:
+                    test_count = match.group(1)
+                    print(f"  [OK] {test_count} tests passed")
+                    all_checks.append(("Test Suite", True))
+                else:
+                    print("  [OK] Tests passed")
+                    all_checks.append(("Test Suite", True))
             else:
-                raise ValueError(f"Provider detection failed for {module}")
-        
-        print(f"  [OK] All {providers_tested} providers detected correctly")
-        all_checks.append(("Provider Detection", True))
-    except Exception as e:
-        print(f"  [FAIL] Provider detection error: {e}")
-        all_checks.append(("Provider Detection", False))
-    
-    # Check 4: Usage extraction
-    print("\n[CHECK 4] Usage extraction patterns...")
-    try:
-        wrapper = CmdrData(
-            client=Mock(),
-            cmdrdata_api_key="test",
-            disable_tracking=True
-        )
-        
-        patterns_tested = 0
-        
-        # OpenAI pattern
-        resp1 = Mock(spec=['usage'])
-        resp1.usage = Mock(
-            spec=['prompt_tokens', 'completion_tokens', 'total_tokens'],
-            prompt_tokens=10, completion_tokens=20, total_tokens=30
-        )
-        usage1 = wrapper._CmdrData__extract_usage(resp1)
-        assert usage1["input_tokens"] == 10
-        assert usage1["output_tokens"] == 20
-        patterns_tested += 1
-        
-        # Anthropic pattern
-        resp2 = Mock(spec=['usage'])
-        resp2.usage = Mock(
-            spec=['input_tokens', 'output_tokens'],
-            input_tokens=15, output_tokens=25
-        )
-        usage2 = wrapper._CmdrData__extract_usage(resp2)
-        assert usage2["input_tokens"] == 15
-        assert usage2["output_tokens"] == 25
-        patterns_tested += 1
-        
-        # Google pattern
-        resp3 = Mock(spec=['usage_metadata'])
-        resp3.usage_metadata = Mock(
-            spec=['prompt_token_count', 'candidates_token_count', 'total_token_count'],
-            prompt_token_count=5, candidates_token_count=15, total_token_count=20
-        )
-        usage3 = wrapper._CmdrData__extract_usage(resp3)
-        assert usage3["input_tokens"] == 5
-        assert usage3["output_tokens"] == 15
-        patterns_tested += 1
-        
-        # Cohere pattern
-        resp4 = Mock(spec=['meta'])
-        resp4.meta = Mock(spec=['billed_units'])
-        resp4.meta.billed_units = Mock(
-            spec=['input_tokens', 'output_tokens'],
-            input_tokens=8, output_tokens=12
-        )
-        usage4 = wrapper._CmdrData__extract_usage(resp4)
-        assert usage4["input_tokens"] == 8
-        assert usage4["output_tokens"] == 12
-        patterns_tested += 1
-        
-        print(f"  [OK] All {patterns_tested} usage patterns work correctly")
-        all_checks.append(("Usage Extraction", True))
-    except Exception as e:
-        print(f"  [FAIL] Usage extraction error: {e}")
-        all_checks.append(("Usage Extraction", False))
-    
-    # Check 5: Context managers
-    print("\n[CHECK 5] Context managers...")
-    try:
-        from cmdrdata.context import (
-            set_customer_context, get_customer_context, clear_customer_context,
-            set_metadata_context, get_metadata_context, clear_metadata_context
-        )
-        
-        # Test customer context
-        clear_customer_context()
-        assert get_customer_context() is None
-        
-        with customer_context("test-customer"):
-            assert get_customer_context() == "test-customer"
-        
-        assert get_customer_context() is None
-        
-        # Test metadata context
-        clear_metadata_context()
-        assert get_metadata_context() == {}
-        
-        with metadata_context({"key": "value"}):
-            assert get_metadata_context()["key"] == "value"
-        
-        assert get_metadata_context() == {}
-        
-        print("  [OK] Context managers work correctly")
-        all_checks.append(("Context Managers", True))
-    except Exception as e:
-        print(f"  [FAIL] Context manager error: {e}")
-        all_checks.append(("Context Managers", False))
-    
-    # Check 6: Error resilience
-    print("\n[CHECK 6] Error resilience...")
-    try:
-        class FailingTracker:
-            def track_usage_background(self, **kwargs):
-                raise Exception("Tracking failed!")
-        
-        class WorkingClient:
-            def process(self, data):
-                return {"result": "success", "usage": Mock(total_tokens=10)}
-        
-        wrapper = CmdrData(
-            client=WorkingClient(),
-            cmdrdata_api_key="test"
-        )
-        wrapper.tracker = FailingTracker()
-        
-        # Should not raise despite tracker failure
-        result = wrapper.process("test data")
-        assert result["result"] == "success"
-        
-        print("  [OK] SDK resilient to tracking failures")
-        all_checks.append(("Error Resilience", True))
-    except Exception as e:
-        print(f"  [FAIL] Error resilience failed: {e}")
-        all_checks.append(("Error Resilience", False))
-    
-    # Check 7: Thread safety
-    print("\n[CHECK 7] Thread safety...")
-    try:
-        import threading
-        
-        results = []
-        lock = threading.Lock()
-        
-        def thread_test(thread_id):
-            with customer_context(f"thread-{thread_id}"):
-                ctx = get_customer_context()
-                with lock:
-                    results.append(ctx)
-        
-        threads = []
-        for i in range(5):
-            t = threading.Thread(target=thread_test, args=(i,))
-            threads.append(t)
-            t.start()
-        
-        for t in threads:
-            t.join()
-        
-        # Each thread should have its own context
-        expected = {f"thread-{i}" for i in range(5)}
-        actual = set(results)
-        
-        if expected == actual:
-            print("  [OK] Thread-safe context management")
-            all_checks.append(("Thread Safety", True))
-        else:
-            raise ValueError(f"Thread safety issue: expected {expected}, got {actual}")
-    except Exception as e:
-        print(f"  [FAIL] Thread safety error: {e}")
-        all_checks.append(("Thread Safety", False))
-    
-    # Check 8: API key handling
-    print("\n[CHECK 8] API key configuration...")
-    try:
-        # Test with environment variable
-        os.environ["CMDRDATA_API_KEY"] = "env-test-key"
-        wrapper = CmdrData(client=Mock())
-        assert wrapper.tracker.api_key == "env-test-key"
-        
-        # Test with explicit key
-        wrapper2 = CmdrData(
-            client=Mock(),
-            cmdrdata_api_key="explicit-key"
-        )
-        assert wrapper2.tracker.api_key == "explicit-key"
-        
-        # Clean up
-        del os.environ["CMDRDATA_API_KEY"]
-        
-        print("  [OK] API key configuration works")
-        all_checks.append(("API Key Config", True))
-    except Exception as e:
-        print(f"  [FAIL] API key configuration error: {e}")
-        all_checks.append(("API Key Config", False))
+                print(f"  [FAIL] Some tests failed")
+                print(f"       Output: {stdout}")
+                all_checks.append(("Test Suite", False))
+        except Exception as e:
+            print(f"  [FAIL] Test execution error: {e}")
+            all_checks.append(("Test Suite", False))
     
-    # Summary
-    print("\n" + "="*70)
-    print(" VALIDATION SUMMARY")
-    print("="*70)
+    # Production readiness checks
+    print("\n[CHECK 2] Production readiness checks...")
+    if os.environ.get("PYTEST_CURRENT_TEST"):
+        # The outer runner collects CHECKS_MODULE as well
+        print("  [SKIP] Production readiness checks (running under pytest)")
+        all_checks.extend((name, True) for name in CHECK_NAMES.values())
+    else:
+        args = [CHECKS_MODULE, "-q"]
+        if importlib.util.find_spec("xdist") is not None:
+            args += ["-n", "auto"]
+        exit_code = pytest.main(args, plugins=[_ValidationSummary(all_checks)])
+
+        # A usage or internal error can stop pytest before the summary runs
+        recorded = {name for name, _ in all_checks}
+        missing = [name for name in CHECK_NAMES.values() if name not in recorded]
+        for name in missing:
+            print(f"  [FAIL] {name} (not run)")
+            all_checks.append((name, False))
+        if exit_code != pytest.ExitCode.OK and all(ok for _, ok in all_checks):
+            print(f"  [FAIL] Readiness checks exited with {exit_code!r}")
+            all_checks.append(("Readiness Run", False))
     
     passed = sum(1 for _, success in all_checks if success)
     total = len(all_checks)
     
-    for check_name, success in all_checks:
-        status = "[PASS]" if success else "[FAIL]"
-        print(f"  {status} {check_name}")
-    
-    print(f"\n  Total: {total} checks")
-    print(f"  Passed: {passed}")
-    print(f"  Failed: {total - passed}")
-    
     if passed == total:
         print("\n" + "="*70)
         print(" [SUCCESS] SDK IS PRODUCTION READY!")